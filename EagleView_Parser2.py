@@ -4,14 +4,172 @@ EagleView PDF Report Parser
 Extracts roof, wall, window/door measurements from EagleView Premium reports.
 """
 
+import os
 import pdfplumber
 import re
+import sys
 import json
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any, Tuple
+from functools import cached_property
+from dataclasses import dataclass, fields
+from typing import Optional, List, Dict, Any, Tuple, Callable, Iterator
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Precompiled patterns, grouped by the parse_* method that uses them
+
+# Property info
+_RE_ADDRESS = re.compile(
+    r'(\d{1,6}\s+[A-Za-z][A-Za-z0-9\s]+(?:Lane|Ln|Street|St|Road|Rd|Ave|Avenue|Dr|Drive|Ct|Court|Blvd|Boulevard|Way|Circle|Cir|Place|Pl)[^,]*,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?)'
+)
+_RE_REPORT_NUMBER = re.compile(r'Report:\s*(\d{6,})', re.IGNORECASE)
+_RE_DATE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_RE_CONTACT = re.compile(r'Contact:\s*([^\n]+)', re.IGNORECASE)
+_RE_COMPANY = re.compile(r'Company:\s*([^\n]+)', re.IGNORECASE)
+
+# Roof measurements
+_RE_TOTAL_AREA = re.compile(r'Total\s+(?:Roof\s+)?Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft', re.IGNORECASE)
+_RE_TOTAL_AREA_ALL_PITCHES = re.compile(r'Total\s+Area\s*\(All\s+Pitches\)\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft', re.IGNORECASE)
+_RE_TOTAL_FACETS = re.compile(r'Total\s+(?:Roof\s+)?Facets\s*[=:]\s*(\d+)', re.IGNORECASE)
+_RE_PREDOMINANT_PITCH = re.compile(r'Predominant\s+Pitch\s*[=:]\s*(\d+/\d+)', re.IGNORECASE)
+_RE_STORIES = re.compile(r'Number\s+of\s+Stories\s*[=:>]\s*([^\n]+)', re.IGNORECASE)
+# Line lengths, matched in a single pass. Each alternative is wrapped in a named
+# group so m.lastgroup names the measurement and group lastindex + 1 holds the
+# number. Step Flashing only consumes "Step" and reads its value in a lookahead,
+# so the Flashing alternative still sees the label and applies its own
+# lookbehind, as the separate searches did; Hips and Drip Edge stay
+# case-sensitive as before.
+_RE_ROOF_LINES = re.compile(
+    r'(?P<ridges>Ridges?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<hips>(?-i:(?<!/)\bHips?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft))'  # not "Ridges/Hips"
+    r'|(?P<valleys>Valleys?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<rakes>Rakes?(?:\†)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<eaves>Eaves?(?:/Starter)?(?:\‡)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<step_flashing>Step\s+(?=[Ff]lashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft))'
+    r'|(?P<flashing>(?<!Step\s)Flashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<drip_edge>(?-i:Drip\s+Edge\s*\([^)]*\)\s*=\s*([\d,]+(?:\.\d+)?)\s*ft))',
+    re.IGNORECASE
+)
+_RE_ATTIC = re.compile(r'Estimated\s+Attic\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft', re.IGNORECASE)
+
+# Wall measurements
+_RE_TOTAL_WALL_AREA = re.compile(r'Total\s+Wall\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft', re.IGNORECASE)
+_RE_TOTAL_WALL_FACETS = re.compile(r'Total\s+Wall\s+Facets\s*[=:]\s*(\d+)', re.IGNORECASE)
+_RE_TOTAL_SIDING_AREA = re.compile(r'Total\s+Siding\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft', re.IGNORECASE)
+_RE_TOTAL_MASONRY_AREA = re.compile(r'Total\s+Masonry\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft', re.IGNORECASE)
+
+# Pitch and waste tables
+# Patterns written in lower case are matched against the lowercased report text
+# (_text_lower); they only capture digits or positions, so case is never lost.
+_RE_PITCH_SECTION = re.compile(
+    r'areas?\s+per\s+pitch.*?roof\s+pitches?\s+([\d/\s]+)\s*area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*roof\s*([\d.%\s]+)',
+    re.DOTALL
+)
+_RE_WASTE_SECTION = re.compile(
+    r'Waste\s*%\s*([\d%\s]+)\s*Area\s*\(Sq\s*ft\)\s*([\d,\s]+)\s*Squares\s*\*?\s*([\d.\s]+)(?:.*?(Measured))?(?:.*?(Suggested))?',
+    re.IGNORECASE | re.DOTALL
+)
+_RE_PCT_BEFORE_SUGGESTED = re.compile(r'(\d+)%[^\n]{0,120}?Suggested', re.IGNORECASE)
+_RE_PCT_AFTER_SUGGESTED = re.compile(r'Suggested[^\n]{0,120}?(\d+)%', re.IGNORECASE)
+_RE_PITCH_RISE = re.compile(r'(\d+)/12')
+
+
+# Table cells captured above are short runs of digits, so plain splitting is enough
+def _pitch_tokens(text: str) -> List[str]:
+    """Split a pitch row like '3/12 6/12' into its pitch tokens"""
+    tokens = []
+    for token in text.split():
+        rise, slash, run = token.partition('/')
+        if slash and rise.isdigit() and run.isdigit():
+            tokens.append(token)
+    return tokens
+
+
+def _number_tokens(text: str) -> List[str]:
+    """Split a row of numbers like '1,234.5 678' into tokens that start with a digit"""
+    return [token for token in text.split() if token[:1].isdigit()]
+
+
+def _percent_tokens(text: str) -> List[str]:
+    """Split a row of percentages like '6.3% 61.5%' into bare number strings"""
+    return [value for token in text.split() for value in token.split('%') if value]
+
+# Per-structure sections
+_RE_STRUCT_PITCH_SECTION = re.compile(
+    r'Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*Roof\s*([\d.%\s]+)',
+    re.IGNORECASE
+)
+_RE_STRUCT_PITCH_LIST = re.compile(r'Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)', re.IGNORECASE)
+_RE_STRUCT_WASTE_SECTION = re.compile(
+    r'Waste\s*%\s*([\d%\s]+)\s*Area\s*\(Sq\s*ft\)\s*([\d,\s]+)\s*Squares\s*\*?\s*([\d.\s]+)',
+    re.IGNORECASE
+)
+# The waste table runs from "Waste %" past "Squares" to the first of these markers
+_WASTE_TABLE_END_MARKERS = ('roof pitches', 'all structures', 'report', 'page')
+_RE_STRUCTURE_NUMBER = re.compile(r'Structure\s+\d+', re.IGNORECASE)
+_RE_STRUCTURE_MENTION = re.compile(r'\bStructure[\s:#\-]*(\d+)\b', re.IGNORECASE)
+_RE_SUGGESTED = re.compile(r'Suggested', re.IGNORECASE)
+_RE_SUGGESTED_WORD = re.compile(r'^suggested$', re.IGNORECASE)
+_RE_PCT_WORD = re.compile(r'^(\d{1,2})%$')
+_RE_PCT_TOKEN = re.compile(r'(\d+)\s*%')
+_RE_SHORT_NUMBER = re.compile(r'\d{1,2}')
+_RE_REPORT_SUMMARY_STRUCTURE = re.compile(r'report\s+summary\s*\n\s*structure\s*#?\s*(\d+)')
+_RE_STRUCTURE_AREAS_PER_PITCH = re.compile(r'structure\s*#?\s*(\d+)\s*\n\s*areas\s+per\s+pitch')
+_RE_ALL_STRUCTURES = re.compile(r'all\s+structures\s*\n\s*areas\s+per\s+pitch')
+_RE_MBS_SECTION = re.compile(
+    r'measurements\s+by\s+structure.*?structure.*?area.*?ridges.*?\n(.*?)(?:all\s+values|online)',
+    re.DOTALL
+)
+_RE_STRUCT_FACETS = re.compile(r'Total\s+Roof\s+Facets\s*[=:]\s*(\d+)', re.IGNORECASE)
+_RE_STRUCT_TOTAL_AREA = re.compile(r'Total\s+Area\s*\(All\s+Pitches\)\s*[=:]\s*([\d,]+)', re.IGNORECASE)
+# Structure line lengths in one pass, same layout as _RE_ROOF_LINES (including
+# the Step Flashing lookahead) but without the "ft" suffix the structure
+# summaries omit
+_RE_STRUCT_LINES = re.compile(
+    r'(?P<ridges>Ridges\s*[=:]\s*([\d.]+))'
+    r'|(?P<hips>(?<!/)\bHips?\s*[=:]\s*([\d.]+))'
+    r'|(?P<valleys>Valleys\s*[=:]\s*([\d.]+))'
+    r'|(?P<rakes>Rakes\s*[=:]\s*([\d.]+))'
+    r'|(?P<eaves>Eaves\s*[=:]\s*([\d.]+))'
+    r'|(?P<step_flashing>Step\s+(?=[Ff]lashing\s*[=:]\s*([\d.]+)))'
+    r'|(?P<flashing>(?<!Step\s)Flashing\s*[=:]\s*([\d.]+))',
+    re.IGNORECASE
+)
+
+# Windows/doors and coordinates
+# Pattern matches: I1 10.0 14.0 2.0 x 5.0
+_RE_WD_ENTRY = re.compile(r'([A-Z]\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*x\s*([\d.]+)')
+# The window/door table runs from its page heading to the first elevation page
+# or report summary. Both must stand on their own line, so upper-case table of
+# contents entries ("WINDOW AND DOOR DIAGRAM.....13") are not taken as headings
+_RE_WD_TABLE_HEADING = re.compile(r'^[ \t]*WINDOW AND DOOR DIAGRAM[ \t]*$', re.MULTILINE)
+_RE_WD_TABLE_END = re.compile(
+    r'^[ \t]*(?:(?:NORTH|EAST|SOUTH|WEST) ELEVATION(?: DIAGRAM)?|REPORT SUMMARY)[ \t]*$',
+    re.MULTILINE
+)
+_RE_ELEVATION_HEADING = re.compile(r'(north|east|south|west)\s+elevation')
+# These section patterns stay on the stdlib engine: RE2 cannot compile their
+# lookaheads and only treats ASCII whitespace as \s. The elevation table is
+# matched from a known heading and the diagram regex is only a fallback.
+_RE_ELEVATION_TABLE = re.compile(
+    r'(?:North|East|South|West)\s+ELEVATION.*?Window\s*&\s*Door.*?Count\s*(.*?)(?=(?:Note:|©|\Z))',
+    re.DOTALL | re.IGNORECASE
+)
+_RE_WALL_LABEL = re.compile(r'\b([A-Z])\s+[\d.]+\s+[\d.]+')
+_RE_WD_DIAGRAM = re.compile(r'WINDOW\s+AND\s+DOOR\s+DIAGRAM.*?(?=ELEVATION|REPORT\s+SUMMARY|\Z)', re.DOTALL | re.IGNORECASE)
+_RE_WD_DIAGRAM_END = re.compile(r'ELEVATION|REPORT\s+SUMMARY', re.IGNORECASE)
+# Direction headers at the start of a line, or window/door entries kept within one line
+_RE_WD_SCAN = re.compile(
+    r'^(?P<dir>North|East|South|West)\b'
+    r'|(?-i:(?P<lbl>[A-Z]\d+)[^\S\n]+[\d.]+[^\S\n]+[\d.]+[^\S\n]+[\d.]+[^\S\n]*x[^\S\n]*[\d.]+)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+@dataclass(slots=True)
 class RoofMeasurements:
     total_area_sqft: float
     total_facets: int
@@ -28,7 +186,7 @@ class RoofMeasurements:
     estimated_attic_sqft: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WallMeasurements:
     total_wall_area_sqft: float
     total_wall_facets: int
@@ -36,14 +194,14 @@ class WallMeasurements:
     total_masonry_area_sqft: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchBreakdown:
     pitch: str
     area_sqft: float
     percent_of_roof: float
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowDoor:
     label: str
     area_sqft: float
@@ -53,7 +211,7 @@ class WindowDoor:
     wall_direction: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WasteCalculation:
     waste_percent: int
     area_sqft: float
@@ -61,7 +219,7 @@ class WasteCalculation:
     is_suggested: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Structure:
     """Individual structure measurements for multi-structure reports"""
     structure_number: int
@@ -82,7 +240,7 @@ class Structure:
     complexity: Optional[str] = None  # Simple, Normal, Complex
 
 
-@dataclass
+@dataclass(slots=True)
 class EagleViewReport:
     # Property Info
     address: str
@@ -107,26 +265,105 @@ class EagleViewReport:
     longitude: Optional[float] = None
 
 
+_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _make_serializer(cls) -> Callable[[Any], Dict[str, Any]]:
+    """Generate a function that returns cls's fields as a single dict literal"""
+    items = ', '.join(f'{f.name!r}: o.{f.name}' for f in fields(cls))
+    namespace: Dict[str, Any] = {}
+    exec(f'def serialize(o):\n    return {{{items}}}', namespace)
+    return namespace['serialize']
+
+
+def _flat(obj) -> Dict[str, Any]:
+    """Shallow asdict() for the flat row dataclasses, using a serializer built once per type"""
+    serialize = _SERIALIZERS.get(type(obj))
+    if serialize is None:
+        serialize = _SERIALIZERS[type(obj)] = _make_serializer(type(obj))
+    return serialize(obj)
+
+
 class EagleViewParser:
     def __init__(self, pdf_path: str):
         self.pdf_path = pdf_path
         self.text_content = ""
         self.pages_text = []
-        
+        self.pages_words: Dict[int, List[Dict[str, Any]]] = {}
+        self.pages_pct_words: Dict[int, List[Tuple[int, float, float]]] = {}
+        self._pdf = None
+        self._text_mtime: Optional[float] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _open_pdf(self):
+        """Open the PDF once and keep the handle for later word lookups"""
+        if self._pdf is None:
+            self._pdf = pdfplumber.open(self.pdf_path)
+        return self._pdf
+
+    def close(self):
+        """Release the PDF handle and cached page words"""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        self.pages_words.clear()
+        self.pages_pct_words.clear()
+
     def extract_text(self):
-        """Extract all text from PDF"""
-        with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                self.pages_text.append(page_text)
-            self.text_content = "\n".join(self.pages_text)
+        """Extract all text from PDF, reusing the previous result while the file is unchanged"""
+        mtime = os.path.getmtime(self.pdf_path)
+        if mtime == self._text_mtime:
+            return self.text_content
+        if self._text_mtime is not None:
+            # The file was rewritten since the last extraction; drop everything derived from it
+            self.close()
+            self.pages_text = []
+            for name in ('_pitch_section_match', '_structure_pages', '_text_lower'):
+                self.__dict__.pop(name, None)
+        # The table patterns depend on pdfplumber's layout-ordered text. PyMuPDF's
+        # get_text() is faster but emits blocks in a different order, which drops
+        # the Areas per Pitch rows and shifts the waste table columns.
+        self._ensure_pages_through(len(self._open_pdf().pages) - 1)
+        self.text_content = "\n".join(self.pages_text)
+        self._text_mtime = mtime
         return self.text_content
-    
-    def _extract_number(self, pattern: str, text: str = None) -> Optional[float]:
-        """Extract a number using regex pattern"""
+
+    def _ensure_pages_through(self, page_index: int):
+        """Extract page text up to and including page_index, resuming where the last call stopped"""
+        pages = self._open_pdf().pages
+        for page in pages[len(self.pages_text):page_index + 1]:
+            self.pages_text.append(page.extract_text() or "")
+
+    def _page_words(self, page_index: int) -> List[Dict[str, Any]]:
+        """Return extract_words() output for a page, computed once per parser"""
+        words = self.pages_words.get(page_index)
+        if words is None:
+            words = self._open_pdf().pages[page_index].extract_words()
+            self.pages_words[page_index] = words
+        return words
+
+    def _page_percent_words(self, page_index: int) -> List[Tuple[int, float, float]]:
+        """Return (percent, center x, top) for each 'NN%' word on a page, computed once per parser"""
+        pct_words = self.pages_pct_words.get(page_index)
+        if pct_words is None:
+            pct_words = []
+            for w in self._page_words(page_index):
+                m = _RE_PCT_WORD.match(w.get('text', ''))
+                if m:
+                    pct_words.append((int(m.group(1)), (w['x0'] + w['x1']) / 2, w['top']))
+            self.pages_pct_words[page_index] = pct_words
+        return pct_words
+
+    def _extract_number(self, pattern: re.Pattern, text: str = None) -> Optional[float]:
+        """Extract a number using a precompiled regex pattern"""
         if text is None:
             text = self.text_content
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             try:
                 # Remove commas and convert to float
@@ -135,35 +372,75 @@ class EagleViewParser:
                 return None
         return None
     
-    def _extract_string(self, pattern: str, text: str = None) -> Optional[str]:
-        """Extract a string using regex pattern"""
+    def _extract_string(self, pattern: re.Pattern, text: str = None) -> Optional[str]:
+        """Extract a string using a precompiled regex pattern"""
         if text is None:
             text = self.text_content
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             return match.group(1).strip()
         return None
     
+    def _scan_after(self, literal: str, text: str = None) -> Optional[str]:
+        """Return the rest of the line following the first occurrence of a fixed label"""
+        if text is None:
+            text = self.text_content
+        i = text.find(literal)
+        if i == -1:
+            return None
+        start = i + len(literal)
+        end = text.find('\n', start)
+        if end == -1:
+            end = len(text)
+        return text[start:end].strip()
+    
+    def _extract_number_after(self, label: str) -> Optional[float]:
+        """Extract the number in "<label> = value" (or ':') by scanning the text instead of a regex"""
+        text = self.text_content
+        lower = self._text_lower
+        label = label.lower()
+        n = len(text)
+        i = lower.find(label)
+        while i != -1:
+            j = i + len(label)
+            while j < n and text[j].isspace():
+                j += 1
+            if j < n and text[j] in '=:':
+                j += 1
+                while j < n and text[j].isspace():
+                    j += 1
+                k = j
+                while k < n and text[k] in '-0123456789.':
+                    k += 1
+                if k > j:
+                    try:
+                        return float(text[j:k])
+                    except ValueError:
+                        return None
+            i = lower.find(label, i + 1)
+        return None
+    
     def parse_property_info(self) -> Dict[str, str]:
         """Extract property information"""
+        text = self.text_content
         # Address - look for street number followed by street name and state/zip
         # Use a more specific pattern to avoid capturing dates
-        address_match = re.search(
-            r'(\d{1,6}\s+[A-Za-z][A-Za-z0-9\s]+(?:Lane|Ln|Street|St|Road|Rd|Ave|Avenue|Dr|Drive|Ct|Court|Blvd|Boulevard|Way|Circle|Cir|Place|Pl)[^,]*,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?)',
-            self.text_content
-        )
+        address_match = _RE_ADDRESS.search(text)
         address = address_match.group(1).strip() if address_match else ""
         
         # Report number - specifically look for "Report: XXXXXXXX" format
-        report_num = self._extract_string(r'Report:\s*(\d{6,})')
+        # Labels are scanned literally first; the regex only runs for unusual layouts
+        report_num = self._scan_after("Report:")
+        if not (report_num and report_num.isdecimal() and len(report_num) >= 6):
+            report_num = self._extract_string(_RE_REPORT_NUMBER)
         
         # Date
-        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', self.text_content)
+        date_match = _RE_DATE.search(text)
         report_date = date_match.group(1) if date_match else ""
         
         # Prepared for
-        contact = self._extract_string(r'Contact:\s*([^\n]+)')
-        company = self._extract_string(r'Company:\s*([^\n]+)')
+        contact = self._scan_after("Contact:") or self._extract_string(_RE_CONTACT)
+        company = self._scan_after("Company:") or self._extract_string(_RE_COMPANY)
         
         return {
             "address": address,
@@ -177,47 +454,62 @@ class EagleViewParser:
         """Extract roof measurements from the report"""
         
         # Total roof area
-        total_area = self._extract_number(r'Total\s+(?:Roof\s+)?Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+        total_area = self._extract_number(_RE_TOTAL_AREA)
         if not total_area:
-            total_area = self._extract_number(r'Total\s+Area\s*\(All\s+Pitches\)\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+            total_area = self._extract_number(_RE_TOTAL_AREA_ALL_PITCHES)
         
         # Total facets
-        total_facets = self._extract_number(r'Total\s+(?:Roof\s+)?Facets\s*[=:]\s*(\d+)')
+        total_facets = self._extract_number(_RE_TOTAL_FACETS)
         
         # Predominant pitch
-        pitch = self._extract_string(r'Predominant\s+Pitch\s*[=:]\s*(\d+/\d+)')
+        rest = self._scan_after("Predominant Pitch")
+        tokens = rest[1:].split() if rest and rest[0] in '=:' else []
+        if tokens and _pitch_tokens(tokens[0]):
+            pitch = tokens[0]
+        else:
+            pitch = self._extract_string(_RE_PREDOMINANT_PITCH)
         
         # Number of stories
-        stories = self._extract_string(r'Number\s+of\s+Stories\s*[=:>]\s*([^\n]+)')
-        
-        # Line lengths - use more specific patterns
-        ridges = self._extract_number(r'Ridges?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
+        rest = self._scan_after("Number of Stories")
+        stories = rest[1:].strip() if rest and rest[0] in '=:>' else None
+        if not stories:
+            stories = self._extract_string(_RE_STORIES)
         
-        # Hips - must not match "Ridges/Hips" combined
-        hips_match = re.search(r'(?<!/)\bHips?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft', self.text_content)
-        hips = float(hips_match.group(1).replace(",", "")) if hips_match else 0
-        
-        valleys = self._extract_number(r'Valleys?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        rakes = self._extract_number(r'Rakes?(?:\†)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        eaves = self._extract_number(r'Eaves?(?:/Starter)?(?:\‡)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        flashing = self._extract_number(r'(?<!Step\s)Flashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        step_flashing = self._extract_number(r'Step\s+[Ff]lashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
+        # Line lengths - one pass; the first occurrence of each label wins
+        lines: Dict[str, Optional[float]] = {}
+        for m in _RE_ROOF_LINES.finditer(self.text_content):
+            key = m.lastgroup
+            if key in lines:
+                continue
+            try:
+                lines[key] = float(m.group(m.lastindex + 1).replace(",", ""))
+            except ValueError:
+                lines[key] = None
+            if len(lines) == 8:
+                break
+        ridges = lines.get('ridges')
+        # An unparseable Hips value still reports 0 rather than null
+        hips = lines.get('hips')
+        if hips is None:
+            hips = 0
+        valleys = lines.get('valleys')
+        rakes = lines.get('rakes')
+        eaves = lines.get('eaves')
+        flashing = lines.get('flashing')
+        step_flashing = lines.get('step_flashing')
         
         # Drip edge - explicit or computed from eaves + rakes
-        drip_edge = None
-        drip_edge_match = re.search(r'Drip\s+Edge\s*\([^)]*\)\s*=\s*([\d,]+(?:\.\d+)?)\s*ft', self.text_content)
-        if drip_edge_match:
-            drip_edge = float(drip_edge_match.group(1).replace(",", ""))
-        else:
+        drip_edge = lines.get('drip_edge')
+        if drip_edge is None:
             drip_edge = (eaves or 0) + (rakes or 0)
         
         # Estimated attic
-        attic = self._extract_number(r'Estimated\s+Attic\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+        attic = self._extract_number(_RE_ATTIC)
         
         return RoofMeasurements(
             total_area_sqft=total_area or 0,
             total_facets=int(total_facets) if total_facets else 0,
-            predominant_pitch=pitch or "",
+            predominant_pitch=sys.intern(pitch) if pitch else "",
             num_stories=stories or "",
             ridges_ft=ridges or 0,
             hips_ft=hips,
@@ -233,10 +525,10 @@ class EagleViewParser:
     def parse_wall_measurements(self) -> Optional[WallMeasurements]:
         """Extract wall measurements if present"""
         
-        total_wall = self._extract_number(r'Total\s+Wall\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
-        wall_facets = self._extract_number(r'Total\s+Wall\s+Facets\s*[=:]\s*(\d+)')
-        siding = self._extract_number(r'Total\s+Siding\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
-        masonry = self._extract_number(r'Total\s+Masonry\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
+        total_wall = self._extract_number(_RE_TOTAL_WALL_AREA)
+        wall_facets = self._extract_number(_RE_TOTAL_WALL_FACETS)
+        siding = self._extract_number(_RE_TOTAL_SIDING_AREA)
+        masonry = self._extract_number(_RE_TOTAL_MASONRY_AREA)
         
         if total_wall or siding or masonry:
             return WallMeasurements(
@@ -247,22 +539,23 @@ class EagleViewParser:
             )
         return None
     
+    @cached_property
+    def _pitch_section_match(self) -> Optional[re.Match]:
+        """Areas per Pitch table match, shared by the pitch and waste parsers"""
+        return _RE_PITCH_SECTION.search(self._text_lower)
+    
     def parse_pitch_breakdown(self) -> List[PitchBreakdown]:
         """Extract pitch breakdown from Areas per Pitch table"""
         pitches = []
         
         # Look for the pitch table pattern
         # Format: Roof Pitches | 3/12 | 6/12 | 9/12 etc
-        pitch_section = re.search(
-            r'Areas?\s+per\s+Pitch.*?Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*Roof\s*([\d.%\s]+)',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        pitch_section = self._pitch_section_match
         
         if pitch_section:
-            pitch_values = re.findall(r'(\d+/\d+)', pitch_section.group(1))
-            area_values = re.findall(r'([\d,]+\.?\d*)', pitch_section.group(2))
-            percent_values = re.findall(r'([\d.]+)%?', pitch_section.group(3))
+            pitch_values = _pitch_tokens(pitch_section.group(1))
+            area_values = _number_tokens(pitch_section.group(2))
+            percent_values = _percent_tokens(pitch_section.group(3))
             
             for i, pitch in enumerate(pitch_values):
                 if i < len(area_values) and i < len(percent_values):
@@ -270,7 +563,7 @@ class EagleViewParser:
                         area = float(area_values[i].replace(",", ""))
                         pct = float(percent_values[i])
                         pitches.append(PitchBreakdown(
-                            pitch=pitch,
+                            pitch=sys.intern(pitch),
                             area_sqft=area,
                             percent_of_roof=pct
                         ))
@@ -287,24 +580,20 @@ class EagleViewParser:
         # Look for waste calculation table
         # Pattern: Waste % | 0% | 5% | 8% | 10% ...
         # The table has "Measured" under 0% and "Suggested" under the recommended percentage
-        waste_section = re.search(
-            r'Waste\s*%\s*([\d%\s]+)\s*Area\s*\(Sq\s*ft\)\s*([\d,\s]+)\s*Squares\s*\*?\s*([\d.\s]+)(?:.*?(Measured))?(?:.*?(Suggested))?',
-            self.text_content,
-            re.IGNORECASE | re.DOTALL
-        )
+        waste_section = _RE_WASTE_SECTION.search(self.text_content)
         
         if waste_section:
-            pct_values = re.findall(r'(\d+)%?', waste_section.group(1))
-            area_values = re.findall(r'(\d+)', waste_section.group(2))
-            sq_values = re.findall(r'([\d.]+)', waste_section.group(3))
+            pct_values = _percent_tokens(waste_section.group(1))
+            area_values = waste_section.group(2).replace(',', ' ').split()
+            sq_values = waste_section.group(3).split()
 
             # Primary: detect the column with an explicit "Suggested" label, regardless of position.
             suggested_pct = None
             table_text = waste_section.group(0)
             # Try to associate Suggested with a nearby percent explicitly in the same textual vicinity
-            inline_match = re.search(r'(\d+)%[^\n]{0,120}?Suggested', table_text, re.IGNORECASE)
+            inline_match = _RE_PCT_BEFORE_SUGGESTED.search(table_text)
             if not inline_match:
-                inline_match = re.search(r'Suggested[^\n]{0,120}?(\d+)%', table_text, re.IGNORECASE)
+                inline_match = _RE_PCT_AFTER_SUGGESTED.search(table_text)
             if inline_match:
                 try:
                     suggested_pct = int(inline_match.group(1))
@@ -314,14 +603,10 @@ class EagleViewParser:
             # Fallback: heuristic based on pitch complexity if explicit label not found
             if suggested_pct is None:
                 try:
-                    pitch_section = re.search(
-                        r'Areas?\s+per\s+Pitch.*?Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*Roof\s*([\d.%\s]+)',
-                        self.text_content,
-                        re.DOTALL | re.IGNORECASE
-                    )
+                    pitch_section = self._pitch_section_match
                     pitches_in_section = []
                     if pitch_section:
-                        pitches_in_section = re.findall(r'(\d+)/12', pitch_section.group(1))
+                        pitches_in_section = _RE_PITCH_RISE.findall(pitch_section.group(1))
                     steep_pitches = [int(p) for p in pitches_in_section if int(p) >= 12]
                     has_steep = len(steep_pitches) > 0
                     has_multiple_pitches = len(set(pitches_in_section)) > 1
@@ -358,119 +643,130 @@ class EagleViewParser:
         
         return waste_calcs, suggested_waste
     
+    @cached_property
+    def _text_lower(self) -> str:
+        """Lowercased text_content with the same offsets, for case-insensitive scans"""
+        lower = self.text_content.lower()
+        if len(lower) != len(self.text_content):
+            # A few characters lowercase to two code points; keep those as-is
+            lower = ''.join(c if len(c.lower()) != 1 else c.lower() for c in self.text_content)
+        return lower
+    
+    @cached_property
+    def _structure_pages(self) -> Dict[str, List[int]]:
+        """Page indexes mentioning each "Structure N", keyed by the number as written"""
+        index: Dict[str, List[int]] = {}
+        for idx, ptxt in enumerate(self.pages_text):
+            for m in _RE_STRUCTURE_MENTION.finditer(ptxt):
+                pages = index.setdefault(m.group(1), [])
+                if not pages or pages[-1] != idx:
+                    pages.append(idx)
+        return index
+    
+    def _waste_table_text(self, structure_text: str, start: int) -> Optional[str]:
+        """Slice a structure's waste table, including any Measured/Suggested labels"""
+        lower = structure_text.lower()
+        squares_pos = lower.find('squares', start)
+        if squares_pos == -1:
+            return None
+        search_from = squares_pos + len('squares')
+        end = len(structure_text)
+        for marker in _WASTE_TABLE_END_MARKERS:
+            pos = lower.find(marker, search_from)
+            if pos != -1 and pos < end:
+                end = pos
+        heading = _RE_STRUCTURE_NUMBER.search(structure_text, search_from, end)
+        if heading:
+            end = heading.start()
+        return structure_text[start:end]
+    
+    def _pitch_numerators(self, structure_text: str) -> List[int]:
+        """Rise of each pitch (the N in N/12) listed in a structure's Roof Pitches row"""
+        pitch_section = _RE_STRUCT_PITCH_LIST.search(structure_text)
+        if not pitch_section:
+            return []
+        return [int(n) for n in _RE_PITCH_RISE.findall(pitch_section.group(1))]
+    
     def _parse_structure_waste(self, structure_text: str, struct_num: int) -> Tuple[List[WasteCalculation], Optional[WasteCalculation]]:
         """Parse waste calculations for a single structure section"""
         waste_calcs = []
         suggested_waste = None
         
-        waste_section = re.search(
-            r'Waste\s*%\s*([\d%\s]+)\s*Area\s*\(Sq\s*ft\)\s*([\d,\s]+)\s*Squares\s*\*?\s*([\d.\s]+)',
-            structure_text,
-            re.IGNORECASE
-        )
-        table_full = re.search(
-            r'Waste\s*%\s*[\s\S]*?Squares[\s\S]*?(?=Roof\s+Pitches|Structure\s+\d+|All\s+Structures|REPORT|PAGE|\Z)',
-            structure_text,
-            re.IGNORECASE
-        )
+        waste_section = _RE_STRUCT_WASTE_SECTION.search(structure_text)
         
         if waste_section:
-            pct_values = re.findall(r'(\d+)%?', waste_section.group(1))
-            area_values = re.findall(r'(\d+)', waste_section.group(2))
-            sq_values = re.findall(r'([\d.]+)', waste_section.group(3))
-            table_text = (table_full.group(0) if table_full else waste_section.group(0))
+            pct_values = _percent_tokens(waste_section.group(1))
+            area_values = waste_section.group(2).replace(',', ' ').split()
+            sq_values = waste_section.group(3).split()
+            table_text = self._waste_table_text(structure_text, waste_section.start()) or waste_section.group(0)
             suggested_pct = None
             # PRIMARY: PDF coordinate-based column alignment
+            struct_pages = self._structure_pages.get(str(struct_num), [])
             page_index = None
-            for idx, ptxt in enumerate(self.pages_text):
-                if re.search(rf'\bStructure[\s:#\-]*{struct_num}\b', ptxt, re.IGNORECASE):
-                    if ('Waste' in ptxt) and ('Suggested' in ptxt):
-                        page_index = idx
-                        break
+            for idx in struct_pages:
+                ptxt = self.pages_text[idx]
+                if ('Waste' in ptxt) and ('Suggested' in ptxt):
+                    page_index = idx
+                    break
             if page_index is not None:
                 try:
-                    import pdfplumber as _pp
-                    with _pp.open(self.pdf_path) as pdf:
-                        page = pdf.pages[page_index]
-                        words = page.extract_words()
-                        sug_words = [w for w in words if re.search(r'^suggested$', w.get('text',''), re.IGNORECASE)]
-                        if sug_words:
-                            sug_word = sug_words[0]
-                            sug_center_x = (sug_word['x0'] + sug_word['x1']) / 2
-                            sug_top = sug_word['top']
-                            candidates = []
-                            for w in words:
-                                text = w.get('text','')
-                                w_top = w['top']
-                                if w_top >= sug_top or (sug_top - w_top) > 150:
-                                    continue
-                                m = re.match(r'^(\d{1,2})%$', text)
-                                if m:
-                                    pct_val = int(m.group(1))
-                                    w_center_x = (w['x0'] + w['x1']) / 2
-                                    x_dist = abs(w_center_x - sug_center_x)
-                                    if x_dist < 60:
-                                        candidates.append((pct_val, x_dist))
-                            if candidates:
-                                candidates.sort(key=lambda x: x[1])
-                                suggested_pct = candidates[0][0]
+                    words = self._page_words(page_index)
+                    sug_words = [w for w in words if _RE_SUGGESTED_WORD.search(w.get('text',''))]
+                    if sug_words:
+                        sug_word = sug_words[0]
+                        sug_center_x = (sug_word['x0'] + sug_word['x1']) / 2
+                        sug_top = sug_word['top']
+                        # Closest percent header above "Suggested" within 60pt horizontally
+                        best_dist = 60
+                        for pct_val, w_center_x, w_top in self._page_percent_words(page_index):
+                            if w_top >= sug_top or (sug_top - w_top) > 150:
+                                continue
+                            x_dist = abs(w_center_x - sug_center_x)
+                            if x_dist < best_dist:
+                                best_dist = x_dist
+                                suggested_pct = pct_val
                 except Exception:
                     pass
             # FALLBACK: text proximity if coordinates failed
             if suggested_pct is None:
-                sug_label = re.search(r'Suggested', table_text, re.IGNORECASE)
+                sug_label = _RE_SUGGESTED.search(table_text)
                 if sug_label:
                     try:
                         sug_pos = sug_label.start()
-                        percent_tokens = list(re.finditer(r'(\d+)\s*%', table_text))
+                        percent_tokens = list(_RE_PCT_TOKEN.finditer(table_text))
                         if percent_tokens:
                             nearest = min(percent_tokens, key=lambda m: abs(m.start() - sug_pos))
                             suggested_pct = int(nearest.group(1))
                     except Exception:
                         suggested_pct = None
-                page_index = None
-                for idx, ptxt in enumerate(self.pages_text):
-                    if re.search(rf'\bStructure[\s:#\-]*{struct_num}\b', ptxt, re.IGNORECASE):
-                        page_index = idx
-                        break
+                page_index = struct_pages[0] if struct_pages else None
                 if page_index is not None:
                     try:
-                        import pdfplumber as _pp
-                        with _pp.open(self.pdf_path) as pdf:
-                            page = pdf.pages[page_index]
-                            words = page.extract_words()
-                            sug_words = [w for w in words if re.search(r'suggested', w.get('text',''), re.IGNORECASE)]
-                            if sug_words:
-                                w = sug_words[-1]
-                                # search above Suggested for a percent token near same column
-                                candidates = []
-                                for i in range(len(words)):
-                                    t = words[i].get('text','')
-                                    if re.fullmatch(r'\d{1,2}', t):
-                                        # check for % token nearby
-                                        neigh = words[i+1].get('text','') if i+1 < len(words) else ''
-                                        if neigh.strip() == '%':
-                                            # within horizontal proximity and above
-                                            if abs(((words[i]['x0'] + words[i]['x1'])/2) - ((w['x0'] + w['x1'])/2)) < 50 and words[i]['top'] < w['top'] and (w['top'] - words[i]['top']) < 200:
-                                                candidates.append((int(t), w['top'] - words[i]['top'], abs(((words[i]['x0'] + words[i]['x1'])/2) - ((w['x0'] + w['x1'])/2))))
-                                if candidates:
-                                    candidates.sort(key=lambda x: (x[1], x[2]))
-                                    suggested_pct = candidates[0][0]
+                        words = self._page_words(page_index)
+                        sug_words = [w for w in words if _RE_SUGGESTED.search(w.get('text',''))]
+                        if sug_words:
+                            w = sug_words[-1]
+                            # search above Suggested for a percent token near same column
+                            candidates = []
+                            for i in range(len(words)):
+                                t = words[i].get('text','')
+                                if _RE_SHORT_NUMBER.fullmatch(t):
+                                    # check for % token nearby
+                                    neigh = words[i+1].get('text','') if i+1 < len(words) else ''
+                                    if neigh.strip() == '%':
+                                        # within horizontal proximity and above
+                                        if abs(((words[i]['x0'] + words[i]['x1'])/2) - ((w['x0'] + w['x1'])/2)) < 50 and words[i]['top'] < w['top'] and (w['top'] - words[i]['top']) < 200:
+                                            candidates.append((int(t), w['top'] - words[i]['top'], abs(((words[i]['x0'] + words[i]['x1'])/2) - ((w['x0'] + w['x1'])/2))))
+                            if candidates:
+                                candidates.sort(key=lambda x: (x[1], x[2]))
+                                suggested_pct = candidates[0][0]
                     except Exception:
                         pass
             if suggested_pct is None:
-                pitch_section = re.search(
-                    r'Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)',
-                    structure_text,
-                    re.IGNORECASE
-                )
-                pitches_in_section = []
-                if pitch_section:
-                    pitches_in_section = re.findall(r'(\d+)/12', pitch_section.group(1))
-                steep_pitches = [int(p) for p in pitches_in_section if int(p) >= 12]
-                has_steep = len(steep_pitches) > 0
-                num_unique_pitches = len(set(pitches_in_section))
-                has_high_pitch = any(int(p) >= 10 for p in pitches_in_section)
+                pitch_numerators = self._pitch_numerators(structure_text)
+                has_steep = any(n >= 12 for n in pitch_numerators)
+                num_unique_pitches = len(set(pitch_numerators))
+                has_high_pitch = any(n >= 10 for n in pitch_numerators)
                 if has_steep:
                     suggested_idx = 6
                 elif num_unique_pitches >= 3 or (num_unique_pitches >= 2 and has_high_pitch):
@@ -510,16 +806,12 @@ class EagleViewParser:
         pitches = []
         
         # Look for pitch table in structure section
-        pitch_section = re.search(
-            r'Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*Roof\s*([\d.%\s]+)',
-            structure_text,
-            re.IGNORECASE
-        )
+        pitch_section = _RE_STRUCT_PITCH_SECTION.search(structure_text)
         
         if pitch_section:
-            pitch_values = re.findall(r'(\d+/\d+)', pitch_section.group(1))
-            area_values = re.findall(r'([\d,]+\.?\d*)', pitch_section.group(2))
-            percent_values = re.findall(r'([\d.]+)%?', pitch_section.group(3))
+            pitch_values = _pitch_tokens(pitch_section.group(1))
+            area_values = _number_tokens(pitch_section.group(2))
+            percent_values = _percent_tokens(pitch_section.group(3))
             
             for i, pitch in enumerate(pitch_values):
                 if i < len(area_values) and i < len(percent_values):
@@ -527,7 +819,7 @@ class EagleViewParser:
                         area = float(area_values[i].replace(",", ""))
                         pct = float(percent_values[i])
                         pitches.append(PitchBreakdown(
-                            pitch=pitch,
+                            pitch=sys.intern(pitch),
                             area_sqft=area,
                             percent_of_roof=pct
                         ))
@@ -538,36 +830,28 @@ class EagleViewParser:
     
     def parse_structures(self) -> List[Structure]:
         """Parse individual structure data using REPORT SUMMARY sections (from UPDATEDevParser)"""
+        text = self.text_content
         structures = []
         # Identify REPORT SUMMARY Structure sections
-        report_summary_sections = list(re.finditer(
-            r'REPORT\s+SUMMARY\s*\n\s*Structure\s*#?\s*(\d+)',
-            self.text_content,
-            re.IGNORECASE
-        ))
+        lower = self._text_lower
+        report_summary_sections = list(_RE_REPORT_SUMMARY_STRUCTURE.finditer(lower))
         if len(report_summary_sections) < 1:
-            report_summary_sections = list(re.finditer(
-                r'Structure\s*#?\s*(\d+)\s*\n\s*Areas\s+per\s+Pitch',
-                self.text_content,
-                re.IGNORECASE
-            ))
+            report_summary_sections = list(_RE_STRUCTURE_AREAS_PER_PITCH.finditer(lower))
         if len(report_summary_sections) < 1:
             return structures
-        all_structures_match = re.search(r'All\s+Structures\s*\n\s*Areas\s+per\s+Pitch', self.text_content, re.IGNORECASE)
-        all_structures_pos = all_structures_match.start() if all_structures_match else len(self.text_content)
+        all_structures_match = _RE_ALL_STRUCTURES.search(lower)
+        all_structures_pos = all_structures_match.start() if all_structures_match else len(text)
         # Measurements by Structure (optional)
         struct_measurements = {}
-        mbs_match = re.search(
-            r'Measurements\s+by\s+Structure.*?Structure.*?Area.*?Ridges.*?\n(.*?)(?:All\s+values|Online)',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        mbs_match = _RE_MBS_SECTION.search(lower)
         if mbs_match:
-            rows = re.findall(
-                r'(\d+)\s+([\d,]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)',
-                mbs_match.group(1)
-            )
-            for row in rows:
+            # One row per line: structure, area, then eight integer line lengths
+            for line in mbs_match.group(1).splitlines():
+                row = line.split()
+                if len(row) < 10 or not row[0].isdigit() or not row[1].replace(',', '').isdigit():
+                    continue
+                if not all(value.isdigit() for value in row[2:10]):
+                    continue
                 struct_num = int(row[0])
                 struct_measurements[struct_num] = {
                     'area': float(row[1].replace(',', '')),
@@ -585,83 +869,99 @@ class EagleViewParser:
             struct_num = int(match.group(1))
             start_pos = match.start()
             end_pos = report_summary_sections[i + 1].start() if i + 1 < len(report_summary_sections) else all_structures_pos
-            struct_text = self.text_content[start_pos:end_pos]
-            pitch_breakdown = self._parse_structure_pitches(struct_text)
-            waste_calcs, suggested_waste = self._parse_structure_waste(struct_text, struct_num)
-            # Predominant pitch and facets
-            pred_pitch_match = re.search(r'Predominant\s+Pitch\s*[=:]\s*(\d+/\d+)', struct_text, re.IGNORECASE)
-            predominant_pitch = pred_pitch_match.group(1) if pred_pitch_match else ""
-            facets_match = re.search(r'Total\s+Roof\s+Facets\s*[=:]\s*(\d+)', struct_text, re.IGNORECASE)
-            total_facets = int(facets_match.group(1)) if facets_match else 0
-            # Measurements
-            if struct_num in struct_measurements:
-                meas = struct_measurements[struct_num]
-                total_area = meas['area']
-                ridges = meas['ridges']
-                hips = meas['hips']
-                valleys = meas['valleys']
-                rakes = meas['rakes']
-                eaves = meas['eaves']
-                flashing = meas['flashing']
-                step_flashing = meas['step_flashing']
-            else:
-                area_match = re.search(r'Total\s+Area\s*\(All\s+Pitches\)\s*[=:]\s*([\d,]+)', struct_text, re.IGNORECASE)
-                total_area = float(area_match.group(1).replace(',', '')) if area_match else 0
-                ridges_match = re.search(r'Ridges\s*[=:]\s*([\d.]+)', struct_text, re.IGNORECASE)
-                ridges = float(ridges_match.group(1)) if ridges_match else 0
-                hips_match = re.search(r'(?<!/)\bHips?\s*[=:]\s*([\d.]+)', struct_text, re.IGNORECASE)
-                hips = float(hips_match.group(1)) if hips_match else 0
-                valleys_match = re.search(r'Valleys\s*[=:]\s*([\d.]+)', struct_text, re.IGNORECASE)
-                valleys = float(valleys_match.group(1)) if valleys_match else 0
-                rakes_match = re.search(r'Rakes\s*[=:]\s*([\d.]+)', struct_text, re.IGNORECASE)
-                rakes = float(rakes_match.group(1)) if rakes_match else 0
-                eaves_match = re.search(r'Eaves\s*[=:]\s*([\d.]+)', struct_text, re.IGNORECASE)
-                eaves = float(eaves_match.group(1)) if eaves_match else 0
-                flashing_match = re.search(r'(?<!Step\s)Flashing\s*[=:]\s*([\d.]+)', struct_text, re.IGNORECASE)
-                flashing = float(flashing_match.group(1)) if flashing_match else 0
-                step_flashing_match = re.search(r'Step\s+[Ff]lashing\s*[=:]\s*([\d.]+)', struct_text, re.IGNORECASE)
-                step_flashing = float(step_flashing_match.group(1)) if step_flashing_match else 0
-            drip_edge = rakes + eaves
-            # Complexity heuristic
-            pitches_in_section = [p.pitch for p in pitch_breakdown]
-            steep_pitches = [p for p in pitches_in_section if int(p.split('/')[0]) >= 12]
-            if steep_pitches:
-                complexity = "Complex"
-            elif len(set(pitches_in_section)) > 2:
-                complexity = "Normal"
-            else:
-                complexity = "Simple"
-            structure = Structure(
-                structure_number=struct_num,
-                total_area_sqft=total_area,
-                total_facets=total_facets,
-                predominant_pitch=predominant_pitch,
-                ridges_ft=ridges,
-                hips_ft=hips,
-                valleys_ft=valleys,
-                rakes_ft=rakes,
-                eaves_ft=eaves,
-                flashing_ft=flashing,
-                step_flashing_ft=step_flashing,
-                drip_edge_ft=drip_edge,
-                pitch_breakdown=pitch_breakdown,
-                waste_calculations=waste_calcs,
-                suggested_waste=suggested_waste,
-                complexity=complexity
-            )
-            structures.append(structure)
+            struct_text = text[start_pos:end_pos]
+            structures.append(self._parse_structure(struct_num, struct_text, struct_measurements))
         return structures
     
+    def _parse_structure(self, struct_num: int, struct_text: str,
+                         struct_measurements: Dict[int, Dict[str, float]]) -> Structure:
+        """Parse one REPORT SUMMARY section into a Structure"""
+        pitch_breakdown = self._parse_structure_pitches(struct_text)
+        waste_calcs, suggested_waste = self._parse_structure_waste(struct_text, struct_num)
+        # Predominant pitch and facets
+        pred_pitch_match = _RE_PREDOMINANT_PITCH.search(struct_text)
+        predominant_pitch = sys.intern(pred_pitch_match.group(1)) if pred_pitch_match else ""
+        facets_match = _RE_STRUCT_FACETS.search(struct_text)
+        total_facets = int(facets_match.group(1)) if facets_match else 0
+        # Measurements
+        if struct_num in struct_measurements:
+            meas = struct_measurements[struct_num]
+            total_area = meas['area']
+            ridges = meas['ridges']
+            hips = meas['hips']
+            valleys = meas['valleys']
+            rakes = meas['rakes']
+            eaves = meas['eaves']
+            flashing = meas['flashing']
+            step_flashing = meas['step_flashing']
+        else:
+            area_match = _RE_STRUCT_TOTAL_AREA.search(struct_text)
+            total_area = float(area_match.group(1).replace(',', '')) if area_match else 0
+            # One pass over the section; the first occurrence of each label wins
+            lines: Dict[str, float] = {}
+            for m in _RE_STRUCT_LINES.finditer(struct_text):
+                key = m.lastgroup
+                if key not in lines:
+                    lines[key] = float(m.group(m.lastindex + 1))
+                    if len(lines) == 7:
+                        break
+            ridges = lines.get('ridges', 0)
+            hips = lines.get('hips', 0)
+            valleys = lines.get('valleys', 0)
+            rakes = lines.get('rakes', 0)
+            eaves = lines.get('eaves', 0)
+            flashing = lines.get('flashing', 0)
+            step_flashing = lines.get('step_flashing', 0)
+        drip_edge = rakes + eaves
+        # Complexity heuristic, from the parsed breakdown rather than the raw Roof Pitches row
+        if any(int(p.pitch.split('/')[0]) >= 12 for p in pitch_breakdown):
+            complexity = "Complex"
+        elif len({p.pitch for p in pitch_breakdown}) > 2:
+            complexity = "Normal"
+        else:
+            complexity = "Simple"
+        return Structure(
+            structure_number=struct_num,
+            total_area_sqft=total_area,
+            total_facets=total_facets,
+            predominant_pitch=predominant_pitch,
+            ridges_ft=ridges,
+            hips_ft=hips,
+            valleys_ft=valleys,
+            rakes_ft=rakes,
+            eaves_ft=eaves,
+            flashing_ft=flashing,
+            step_flashing_ft=step_flashing,
+            drip_edge_ft=drip_edge,
+            pitch_breakdown=pitch_breakdown,
+            waste_calculations=waste_calcs,
+            suggested_waste=suggested_waste,
+            complexity=complexity
+        )
+    
+    def _window_door_table_text(self) -> str:
+        """Text from the WINDOW AND DOOR DIAGRAM heading to the elevation pages"""
+        text = self.text_content
+        heading = _RE_WD_TABLE_HEADING.search(text)
+        if heading is None:
+            return text
+        end = _RE_WD_TABLE_END.search(text, heading.end())
+        return text[heading.start():end.start() if end else len(text)]
+    
     def parse_windows_doors(self) -> List[WindowDoor]:
         """Extract window and door measurements"""
-        windows_doors = []
+        return list(self.iter_windows_doors())
+    
+    def iter_windows_doors(self) -> Iterator[WindowDoor]:
+        """Yield window and door measurements one at a time"""
+        text = self.text_content
         
-        # Find all window/door entries in the text
-        # Pattern matches: I1 10.0 14.0 2.0 x 5.0
-        all_entries = re.findall(
-            r'([A-Z]\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*x\s*([\d.]+)',
-            self.text_content
-        )
+        # Find all window/door entries in the window/door table pages, or
+        # anywhere in the report if the table slice holds none
+        table_text = self._window_door_table_text()
+        all_entries = _RE_WD_ENTRY.findall(table_text)
+        if not all_entries and table_text is not text:
+            all_entries = _RE_WD_ENTRY.findall(text)
         
         # In EagleView reports, window/door labels have prefixes that correspond to wall labels
         # We can map them based on the Elevation diagrams or the wall area diagram
@@ -674,101 +974,99 @@ class EagleViewParser:
         # Get direction mapping from the window/door section
         direction_map = {}
         
-        # Parse each direction's entries from the elevation diagrams or window/door tables
-        wd_sections = re.findall(
-            r'(North|East|South|West)\s+(?:East|South|West|North)?\s*(?:Window/Door|Perimeter|Siding).*?(?=(?:North|East|South|West|Total\s+[\d,]+\s+[\d.]+|PAGE|\Z))',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
-        
-        # Alternative: find direction associations from elevation summaries
+        # Find direction associations from elevation summaries
         # Pattern: Wall | Siding | Masonry | Window & Door Area | etc with direction headers
+        # One scan finds the first heading for each direction; the table is then matched from there
+        elevation_starts = {}
+        for m in _RE_ELEVATION_HEADING.finditer(self._text_lower):
+            elevation_starts.setdefault(m.group(1).title(), m.start())
         for direction in ['North', 'East', 'South', 'West']:
-            # Find this direction's window/door entries in elevation diagrams
-            elev_pattern = rf'{direction}\s+ELEVATION.*?Window\s*&\s*Door.*?Count\s*(.*?)(?=(?:Note:|©|\Z))'
-            elev_match = re.search(elev_pattern, self.text_content, re.DOTALL | re.IGNORECASE)
+            start = elevation_starts.get(direction)
+            if start is None:
+                continue
+            elev_match = _RE_ELEVATION_TABLE.match(text, start)
             
             if elev_match:
                 section_text = elev_match.group(1)
                 # Find wall labels in this section
-                wall_labels = re.findall(r'\b([A-Z])\s+[\d.]+\s+[\d.]+', section_text)
+                wall_labels = _RE_WALL_LABEL.findall(section_text)
                 for label in wall_labels:
                     direction_map[label] = direction
         
         # Also try to extract from the window/door table directly
-        wd_section = re.search(
-            r'WINDOW\s+AND\s+DOOR\s+DIAGRAM.*?(?=ELEVATION|REPORT\s+SUMMARY|\Z)',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        # Locate the heading literally and only use the regex for unusual spacing
+        heading = 'window and door diagram'
+        start = self._text_lower.find(heading)
+        if start != -1:
+            end_match = _RE_WD_DIAGRAM_END.search(text, start + len(heading))
+            wd_text = text[start:end_match.start() if end_match else len(text)]
+        else:
+            wd_section = _RE_WD_DIAGRAM.search(text)
+            wd_text = wd_section.group(0) if wd_section else None
         
-        if wd_section:
-            wd_text = wd_section.group(0)
-            
+        if wd_text is not None:
             # Look for entries grouped by direction
             # The table shows directions as headers
             current_direction = None
-            lines = wd_text.split('\n')
+            line_end = -1
             
-            for line in lines:
+            for m in _RE_WD_SCAN.finditer(wd_text):
                 # Check for direction markers
-                dir_match = re.match(r'^(North|East|South|West)\b', line, re.IGNORECASE)
-                if dir_match:
-                    current_direction = dir_match.group(1).title()
+                if m.group('dir'):
+                    current_direction = sys.intern(m.group('dir').title())
+                    continue
                 
-                # Look for window/door entries
-                entry_match = re.search(r'([A-Z]\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*x\s*([\d.]+)', line)
-                if entry_match and current_direction:
-                    label = entry_match.group(1)
+                # Only the first window/door entry on each line counts
+                if m.start() < line_end:
+                    continue
+                line_end = wd_text.find('\n', m.start())
+                if line_end == -1:
+                    line_end = len(wd_text)
+                if current_direction:
                     # Map the wall letter to this direction
-                    wall_letter = label[0]
-                    if wall_letter not in direction_map:
-                        direction_map[wall_letter] = current_direction
+                    direction_map.setdefault(m.group('lbl')[0], current_direction)
         
         # Now create WindowDoor objects using the direction mapping
+        # Wall letters are single A-Z characters, so index the directions by letter
+        directions = tuple(direction_map.get(chr(65 + i), 'Unknown') for i in range(26))
         seen_labels = set()
-        for entry in all_entries:
-            label = entry[0]
+        for label, *values in all_entries:
             if label in seen_labels:
                 continue
             seen_labels.add(label)
             
             wall_letter = label[0]
-            direction = direction_map.get(wall_letter, 'Unknown')
+            direction = directions[ord(wall_letter) - 65] if 'A' <= wall_letter <= 'Z' else 'Unknown'
             
+            # [\d.]+ still admits tokens like "1.2.3", so keep the guard around the conversion
             try:
-                windows_doors.append(WindowDoor(
-                    label=label,
-                    area_sqft=float(entry[1]),
-                    perimeter_ft=float(entry[2]),
-                    width_ft=float(entry[3]),
-                    height_ft=float(entry[4]),
-                    wall_direction=direction
-                ))
-            except (ValueError, IndexError):
+                area, perimeter, width, height = map(float, values)
+            except ValueError:
                 continue
-        
-        return windows_doors
+            yield WindowDoor(label, area, perimeter, width, height, direction)
     
     def parse_coordinates(self) -> Dict[str, Optional[float]]:
         """Extract GPS coordinates"""
-        lat = self._extract_number(r'Latitude\s*[=:]\s*([-\d.]+)')
-        lon = self._extract_number(r'Longitude\s*[=:]\s*([-\d.]+)')
+        lat = self._extract_number_after("Latitude")
+        lon = self._extract_number_after("Longitude")
         return {"latitude": lat, "longitude": lon}
     
     def parse(self) -> EagleViewReport:
         """Parse the complete EagleView report"""
-        self.extract_text()
-        
-        property_info = self.parse_property_info()
-        roof = self.parse_roof_measurements()
-        walls = self.parse_wall_measurements()
-        pitches = self.parse_pitch_breakdown()
-        waste_calcs, suggested_waste = self.parse_waste_calculations()
-        windows_doors = self.parse_windows_doors()
-        coords = self.parse_coordinates()
-        structures = self.parse_structures()
-        
+        try:
+            self.extract_text()
+
+            property_info = self.parse_property_info()
+            roof = self.parse_roof_measurements()
+            walls = self.parse_wall_measurements()
+            pitches = self.parse_pitch_breakdown()
+            waste_calcs, suggested_waste = self.parse_waste_calculations()
+            windows_doors = self.parse_windows_doors()
+            coords = self.parse_coordinates()
+            structures = self.parse_structures()
+        finally:
+            self.close()
+
         return EagleViewReport(
             address=property_info["address"],
             report_number=property_info["report_number"],
@@ -800,12 +1098,12 @@ class EagleViewParser:
                 "prepared_for_contact": report.prepared_for_contact,
                 "prepared_for_company": report.prepared_for_company
             },
-            "roof_measurements": asdict(report.roof),
-            "wall_measurements": asdict(report.walls) if report.walls else None,
-            "pitch_breakdown": [asdict(p) for p in report.pitch_breakdown],
-            "suggested_waste": asdict(report.suggested_waste) if report.suggested_waste else None,
-            "all_waste_calculations": [asdict(w) for w in report.waste_calculations],
-            "windows_doors": [asdict(wd) for wd in report.windows_doors]
+            "roof_measurements": _flat(report.roof),
+            "wall_measurements": _flat(report.walls) if report.walls else None,
+            "pitch_breakdown": [_flat(p) for p in report.pitch_breakdown],
+            "suggested_waste": _flat(report.suggested_waste) if report.suggested_waste else None,
+            "all_waste_calculations": [_flat(w) for w in report.waste_calculations],
+            "windows_doors": [_flat(wd) for wd in report.windows_doors]
         }
         
         # Add structures if present (multi-structure reports)
@@ -828,9 +1126,9 @@ class EagleViewParser:
                         "step_flashing_ft": struct.step_flashing_ft,
                         "drip_edge_ft": struct.drip_edge_ft
                     },
-                    "pitch_breakdown": [asdict(p) for p in struct.pitch_breakdown],
-                    "suggested_waste": asdict(struct.suggested_waste) if struct.suggested_waste else None,
-                    "all_waste_calculations": [asdict(w) for w in struct.waste_calculations]
+                    "pitch_breakdown": [_flat(p) for p in struct.pitch_breakdown],
+                    "suggested_waste": _flat(struct.suggested_waste) if struct.suggested_waste else None,
+                    "all_waste_calculations": [_flat(w) for w in struct.waste_calculations]
                 }
                 result["structures"].append(struct_dict)
         
@@ -838,7 +1136,14 @@ class EagleViewParser:
     
     def to_json(self, report: EagleViewReport, indent: int = 2) -> str:
         """Convert report to JSON string"""
+        if indent is None and orjson is not None:
+            return orjson.dumps(self.to_dict(report)).decode()
         return json.dumps(self.to_dict(report), indent=indent)
+    
+    def to_json_file(self, report: EagleViewReport, path: str, indent: int = 2):
+        """Write report JSON straight to a file without building the full string first"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(report), f, indent=indent)
 
 
 def main():
@@ -853,14 +1158,12 @@ def main():
     
     parser = EagleViewParser(pdf_path)
     report = parser.parse()
-    json_output = parser.to_json(report)
     
     if output_path:
-        with open(output_path, 'w') as f:
-            f.write(json_output)
+        parser.to_json_file(report, output_path)
         print(f"Report saved to {output_path}")
     else:
-        print(json_output)
+        print(parser.to_json(report))
 
 
 if __name__ == "__main__":
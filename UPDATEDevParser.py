@@ -5,13 +5,215 @@ Extracts roof, wall, window/door measurements from EagleView Premium reports.
 """
 
 import pdfplumber
+import hashlib
+import os
+import pickle
 import re
 import json
-from dataclasses import dataclass, asdict
-from typing import Optional, List, Dict, Any, Tuple
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, is_dataclass
+from typing import Optional, List, Dict, Any, Tuple, Callable
 
+try:
+    import pcre2
+except ImportError:
+    pcre2 = None
 
-@dataclass
+
+def _compile_jit(pattern: str):
+    """Compile a document-scale pattern with PCRE2's JIT, or with re if pcre2 is missing.
+
+    Flags must be given inline ((?i), (?m)) since the two modules number them differently.
+    """
+    if pcre2 is not None:
+        return pcre2.compile(pattern, jit=True)
+    return re.compile(pattern)
+
+
+# Precompiled patterns, grouped by the parse method that uses them.
+# The patterns that scan the whole report (pitch and waste tables, elevation
+# headings, window/door table) go through _compile_jit;
+# PCRE2's JIT runs them 4-30x faster than re, while the regex module was no
+# faster. The rest stay on the stdlib engine. google-re2 was measured 7-18x
+# slower on the address, Areas per Pitch and waste table searches (it
+# re-encodes the text to UTF-8 on every call and these matches are found
+# early), and it cannot compile the lookbehinds and lookaheads used below.
+
+# Property info
+_RE_ADDRESS = re.compile(
+    r'(\d{1,6}\s+[A-Za-z][A-Za-z0-9\s]+(?:Lane|Ln|Street|St|Road|Rd|Ave|Avenue|Dr|Drive|Ct|Court|Blvd|Boulevard|Way|Circle|Cir|Place|Pl)[^,]*,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?)'
+)
+_RE_REPORT_NUMBER = re.compile(r'Report:\s*(\d{6,})', re.IGNORECASE)
+_RE_DATE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_RE_CONTACT = re.compile(r'Contact:\s*([^\n]+)', re.IGNORECASE)
+_RE_COMPANY = re.compile(r'Company:\s*([^\n]+)', re.IGNORECASE)
+
+# Patterns written in lower case are matched against the lowercased report
+# text (_text_lower / _summary_lower) instead of using IGNORECASE; they only
+# capture digits or positions, so case is never lost.
+
+# Roof measurements
+_RE_TOTAL_AREA = re.compile(r'total\s+(?:roof\s+)?area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+_RE_TOTAL_AREA_ALL_PITCHES = re.compile(r'total\s+area\s*\(all\s+pitches\)\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+_RE_TOTAL_FACETS = re.compile(r'total\s+(?:roof\s+)?facets\s*[=:]\s*(\d+)')
+_RE_PREDOMINANT_PITCH = re.compile(r'predominant\s+pitch\s*[=:]\s*(\d+/\d+)')
+_RE_STORIES = re.compile(r'Number\s+of\s+Stories\s*[=:>]\s*([^\n]+)', re.IGNORECASE)
+# Line lengths, matched in a single pass. Each alternative is wrapped in a group
+# named after its RoofMeasurements field, so m.lastgroup names the field and
+# group lastindex + 1 holds the number. Step Flashing only consumes "Step" and
+# reads its value in a lookahead, so the Flashing alternative still sees the
+# label and applies its own lookbehind, as the separate searches did; Hips and
+# Drip Edge stay case-sensitive as before. It runs over the str text: in a
+# bytes pattern \s and \b are ASCII-only and would miss a no-break space
+# around "=". It stays on re because pcre2 loses lastgroup when the match
+# ends on a group captured inside a lookahead.
+_RE_ROOF_LINES = re.compile(
+    r'(?i)(?P<ridges_ft>Ridges?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<hips_ft>(?-i:(?<!/)\bHips?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft))'  # not "Ridges/Hips"
+    r'|(?P<valleys_ft>Valleys?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<rakes_ft>Rakes?(?:\†)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<eaves_ft>Eaves?(?:/Starter)?(?:\‡)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<step_flashing_ft>Step\s+(?=[Ff]lashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft))'
+    r'|(?P<flashing_ft>(?<!Step\s)Flashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<drip_edge_ft>(?-i:Drip\s+Edge\s*\([^)]*\)\s*=\s*([\d,]+(?:\.\d+)?)\s*ft))'
+)
+_RE_ATTIC = re.compile(r'estimated\s+attic\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+# Values used for roof fields that are missing or parsed as zero
+_ROOF_DEFAULTS = {
+    'total_area_sqft': 0,
+    'total_facets': 0,
+    'predominant_pitch': "",
+    'num_stories': "",
+    'ridges_ft': 0,
+    'hips_ft': 0,
+    'valleys_ft': 0,
+    'rakes_ft': 0,
+    'eaves_ft': 0,
+    'flashing_ft': 0,
+    'step_flashing_ft': 0,
+    'drip_edge_ft': 0,
+    'estimated_attic_sqft': None,
+}
+
+# Wall measurements
+_RE_TOTAL_WALL_AREA = re.compile(r'total\s+wall\s+area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
+_RE_TOTAL_WALL_FACETS = re.compile(r'total\s+wall\s+facets\s*[=:]\s*(\d+)')
+_RE_TOTAL_SIDING_AREA = re.compile(r'total\s+siding\s+area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
+_RE_TOTAL_MASONRY_AREA = re.compile(r'total\s+masonry\s+area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
+
+# Pitch and waste tables. These, the per-structure sections and the
+# coordinates are read from the REPORT SUMMARY pages onwards. The upper-case
+# heading skips the title-case table of contents entry. On _text_lower, a
+# heading in another case still counts when it stands on its own line or opens
+# a structure section, as parse_structures matches those case-insensitively
+_RE_REPORT_SUMMARY = re.compile(r'REPORT\s+SUMMARY')
+_RE_REPORT_SUMMARY_ANY_CASE = re.compile(
+    r'report\s+summary(?:[ \t]*$|\s*\n\s*structure\s*#?\s*(\d))', re.MULTILINE
+)
+_RE_PITCH_SECTION = _compile_jit(
+    r'(?s)areas?\s+per\s+pitch.*?roof\s+pitches?\s+([\d/\s]+)\s*area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*roof\s*([\d.%\s]+)'
+)
+# The "Measured" marker after the table is looked up with str.find rather than
+# an optional lazy .*? tail, which the engine would retry on every attempt
+_RE_WASTE_SECTION = _compile_jit(
+    r'waste\s*%\s*([\d%\s]+)\s*area\s*\(sq\s*ft\)\s*([\d,\s]+)\s*squares\s*\*?\s*([\d.\s]+)'
+)
+# "Measured" anywhere after the first Waste % header, not only after the matched table
+_RE_FULL_WASTE_SECTION = re.compile(r'Waste\s*%\s*([\d%\s]+).*?Measured\s*(Suggested)?', re.IGNORECASE | re.DOTALL)
+_RE_PITCH_VALUE = re.compile(r'(\d+/\d+)')
+_RE_PITCH_RISE = re.compile(r'(\d+)/12')
+_RE_AREA_VALUE = re.compile(r'([\d,]+\.?\d*)')
+_RE_PERCENT_VALUE = re.compile(r'([\d.]+)%?')
+_RE_WASTE_PCT_VALUE = re.compile(r'(\d+)%?')
+_RE_INTEGER_VALUE = re.compile(r'(\d+)')
+_RE_DECIMAL_VALUE = re.compile(r'([\d.]+)')
+
+# Per-structure sections
+_RE_STRUCT_WASTE_SECTION = re.compile(
+    r'Waste\s*%\s*([\d%\s]+)\s*Area\s*\(Sq\s*ft\)\s*([\d,\s]+)\s*Squares\s*\*?\s*([\d.\s]+)',
+    re.IGNORECASE
+)
+_RE_STRUCT_PITCH_LIST = re.compile(r'Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)', re.IGNORECASE)
+_RE_STRUCT_PITCH_SECTION = re.compile(
+    r'Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*Roof\s*([\d.%\s]+)',
+    re.IGNORECASE
+)
+_RE_REPORT_SUMMARY_STRUCTURE = re.compile(r'report\s+summary\s*\n\s*structure\s*#?\s*(\d+)')
+_RE_STRUCTURE_AREAS_PER_PITCH = re.compile(r'structure\s*#?\s*(\d+)\s*\n\s*areas\s+per\s+pitch')
+_RE_ALL_STRUCTURES = re.compile(r'all\s+structures\s*\n\s*areas\s+per\s+pitch')
+_RE_MBS_SECTION = re.compile(
+    r'measurements\s+by\s+structure.*?structure.*?area.*?ridges.*?\n(.*?)(?:all\s+values|online)',
+    re.DOTALL
+)
+# Per-structure scalar fields in one pass, same layout as _RE_ROOF_LINES but
+# case-sensitive; line lengths have no units
+_RE_STRUCT_FIELDS = re.compile(
+    r'(?P<predominant_pitch>Predominant\s+Pitch\s*[=:]\s*(\d+/\d+))'
+    r'|(?P<facets>Total\s+Roof\s+Facets\s*[=:]\s*(\d+))'
+    r'|(?P<area>Total\s+Area\s*\(All\s+Pitches\)\s*[=:]\s*([\d,]+))'
+    r'|(?P<ridges>Ridges\s*[=:]\s*(\d+))'
+    r'|(?P<hips>(?<!/)\bHips?\s*[=:]\s*(\d+))'
+    r'|(?P<valleys>Valleys\s*[=:]\s*(\d+))'
+    r'|(?P<rakes>Rakes\s*[=:]\s*(\d+))'
+    r'|(?P<eaves>Eaves\s*[=:]\s*(\d+))'
+    r'|(?P<step_flashing>Step\s*flashing\s*[=:]\s*(\d+))'
+    r'|(?P<flashing>(?<!Step\s)Flashing\s*[=:]\s*(\d+))'
+)
+
+# Windows/doors and coordinates
+# Pattern matches: I1 10.0 14.0 2.0 x 5.0
+_RE_WD_ENTRY = re.compile(r'([A-Z]\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*x\s*([\d.]+)')
+# One scan finds the first heading for each direction; the table is then
+# matched from that position
+_RE_ELEVATION_HEADING = _compile_jit(r'(north|east|south|west)\s+elevation')
+_RE_ELEVATION_TABLE = re.compile(
+    r'(?:North|East|South|West)\s+ELEVATION.*?Window\s*&\s*Door.*?Count\s*(.*?)(?=(?:Note:|©|\Z))',
+    re.DOTALL | re.IGNORECASE
+)
+_RE_WALL_LABEL = re.compile(r'\b([A-Z])\s+[\d.]+\s+[\d.]+')
+_RE_WD_DIAGRAM = re.compile(r'WINDOW\s+AND\s+DOOR\s+DIAGRAM.*?(?=ELEVATION|REPORT\s+SUMMARY|\Z)', re.DOTALL | re.IGNORECASE)
+_RE_WD_DIAGRAM_END = re.compile(r'ELEVATION|REPORT\s+SUMMARY', re.IGNORECASE)
+# Direction headers at the start of a line, or window/door entries kept within one line
+_RE_WD_SCAN = _compile_jit(
+    r'(?im)^(?P<dir>North|East|South|West)\b'
+    r'|(?-i:(?P<lbl>[A-Z]\d+)[^\S\n]+[\d.]+[^\S\n]+[\d.]+[^\S\n]+[\d.]+[^\S\n]*x[^\S\n]*[\d.]+)'
+)
+_RE_LATITUDE = re.compile(r'latitude\s*[=:]\s*([-\d.]+)')
+_RE_LONGITUDE = re.compile(r'longitude\s*[=:]\s*([-\d.]+)')
+
+# Parsed reports are cached under the SHA-256 of the PDF bytes when the parser
+# is given a cache directory. Bump the version whenever the dataclasses or the
+# parsing rules change so older pickles are ignored.
+_CACHE_VERSION = 3
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "eagleview")
+
+# Fewest pages worth handing to a worker process; below this the reopen and
+# process start-up cost more than the extraction they save
+_MIN_PAGES_PER_WORKER = 8
+
+
+def _lower_preserving_offsets(text: str) -> str:
+    """Lowercase text so every character keeps its offset"""
+    lower = text.lower()
+    if len(lower) != len(text):
+        # A few characters lowercase to two code points; keep those as-is
+        lower = ''.join(c if len(c.lower()) != 1 else c.lower() for c in text)
+    return lower
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract text for pages [start, stop); runs in a worker process"""
+    # pdfplumber handles can't be pickled, so each worker opens the file itself
+    pages_text = []
+    with pdfplumber.open(pdf_path, pages=range(start + 1, stop + 1)) as pdf:
+        for page in pdf.pages:
+            pages_text.append(page.extract_text() or "")
+            page.close()
+    return pages_text
+
+
+@dataclass(slots=True)
 class RoofMeasurements:
     total_area_sqft: float
     total_facets: int
@@ -28,7 +230,7 @@ class RoofMeasurements:
     estimated_attic_sqft: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WallMeasurements:
     total_wall_area_sqft: float
     total_wall_facets: int
@@ -36,14 +238,14 @@ class WallMeasurements:
     total_masonry_area_sqft: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchBreakdown:
     pitch: str
     area_sqft: float
     percent_of_roof: float
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowDoor:
     label: str
     area_sqft: float
@@ -53,7 +255,7 @@ class WindowDoor:
     wall_direction: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WasteCalculation:
     waste_percent: int
     area_sqft: float
@@ -61,7 +263,7 @@ class WasteCalculation:
     is_suggested: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Structure:
     """Individual structure measurements for multi-structure reports"""
     structure_number: int
@@ -82,7 +284,7 @@ class Structure:
     complexity: Optional[str] = None  # Simple, Normal, Complex
 
 
-@dataclass
+@dataclass(slots=True)
 class EagleViewReport:
     # Property Info
     address: str
@@ -107,39 +309,94 @@ class EagleViewReport:
     longitude: Optional[float] = None
 
 
+def _fields_dict(obj) -> Dict[str, Any]:
+    """Shallow asdict() for the flat row dataclasses"""
+    return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+
+
+def _json_default(obj):
+    """json default hook that encodes row dataclasses as they are reached"""
+    if is_dataclass(obj):
+        return _fields_dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class EagleViewParser:
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, cache_dir: Optional[str] = None):
         self.pdf_path = pdf_path
+        self.cache_dir = cache_dir
         self.text_content = ""
         self.pages_text = []
+        self._text_lower = ""
+        self._summary_text = ""
+        self._summary_lower = ""
         
     def extract_text(self):
         """Extract all text from PDF"""
+        # The table patterns depend on pdfplumber's layout-ordered text;
+        # pypdfium2 and pdfminer's extract_text emit a different order that
+        # drops the Areas per Pitch rows. Only the text is kept, so each
+        # page's chars/lines/rects are released as soon as it is read.
         with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                self.pages_text.append(page_text)
-            self.text_content = "\n".join(self.pages_text)
+            num_pages = len(pdf.pages)
+            workers = min(os.cpu_count() or 1, num_pages // _MIN_PAGES_PER_WORKER)
+            if workers <= 1:
+                for page in pdf.pages:
+                    page_text = page.extract_text() or ""
+                    page.close()
+                    self.pages_text.append(page_text)
+        
+        if workers > 1:
+            # One contiguous range per worker so each opens the file only once
+            bounds = [num_pages * i // workers for i in range(workers + 1)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunk in executor.map(_extract_page_range, [self.pdf_path] * workers, bounds[:-1], bounds[1:]):
+                    self.pages_text.extend(chunk)
+        
+        self.text_content = "\n".join(self.pages_text)
+        # Literal anchors are found with str.find; the lowercased copy covers
+        # the case-insensitive ones
+        self._text_lower = _lower_preserving_offsets(self.text_content)
+        summary_start = self._locate_summary()
+        self._summary_text = self.text_content[summary_start:]
+        self._summary_lower = self._text_lower[summary_start:]
         return self.text_content
     
-    def _extract_number(self, pattern: str, text: str = None) -> Optional[float]:
-        """Extract a number using regex pattern"""
+    def _locate_summary(self) -> int:
+        """Offset of the first REPORT SUMMARY heading, or 0 to scan the whole document"""
+        start = self.text_content.find('REPORT SUMMARY')
+        if start == -1:
+            # Irregular spacing in the heading
+            match = _RE_REPORT_SUMMARY.search(self.text_content)
+            start = match.start() if match else len(self.text_content)
+        # An earlier heading in another case must not be cut off
+        lower = self._text_lower
+        for match in _RE_REPORT_SUMMARY_ANY_CASE.finditer(lower, 0, start):
+            line_start = lower.rfind('\n', 0, match.start()) + 1
+            if match.group(1) or not lower[line_start:match.start()].strip(' \t'):
+                start = match.start()
+                break
+        return start if start < len(self.text_content) else 0
+    
+    def _extract_number(self, pattern: re.Pattern, text: str = None) -> Optional[float]:
+        """Extract a number using a precompiled regex pattern"""
         if text is None:
             text = self.text_content
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             try:
-                # Remove commas and convert to float
-                return float(match.group(1).replace(",", ""))
+                value = match.group(1)
+                # Only strip thousands separators when there are any
+                return float(value.replace(",", "")) if "," in value else float(value)
             except (ValueError, IndexError):
                 return None
         return None
     
-    def _extract_string(self, pattern: str, text: str = None) -> Optional[str]:
-        """Extract a string using regex pattern"""
+    def _extract_string(self, pattern: re.Pattern, text: str = None) -> Optional[str]:
+        """Extract a string using a precompiled regex pattern"""
         if text is None:
             text = self.text_content
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             return match.group(1).strip()
         return None
@@ -148,22 +405,19 @@ class EagleViewParser:
         """Extract property information"""
         # Address - look for street number followed by street name and state/zip
         # Use a more specific pattern to avoid capturing dates
-        address_match = re.search(
-            r'(\d{1,6}\s+[A-Za-z][A-Za-z0-9\s]+(?:Lane|Ln|Street|St|Road|Rd|Ave|Avenue|Dr|Drive|Ct|Court|Blvd|Boulevard|Way|Circle|Cir|Place|Pl)[^,]*,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?)',
-            self.text_content
-        )
+        address_match = _RE_ADDRESS.search(self.text_content)
         address = address_match.group(1).strip() if address_match else ""
         
         # Report number - specifically look for "Report: XXXXXXXX" format
-        report_num = self._extract_string(r'Report:\s*(\d{6,})')
+        report_num = self._extract_string(_RE_REPORT_NUMBER)
         
         # Date
-        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', self.text_content)
+        date_match = _RE_DATE.search(self.text_content)
         report_date = date_match.group(1) if date_match else ""
         
         # Prepared for
-        contact = self._extract_string(r'Contact:\s*([^\n]+)')
-        company = self._extract_string(r'Company:\s*([^\n]+)')
+        contact = self._extract_string(_RE_CONTACT)
+        company = self._extract_string(_RE_COMPANY)
         
         return {
             "address": address,
@@ -176,67 +430,56 @@ class EagleViewParser:
     def parse_roof_measurements(self) -> RoofMeasurements:
         """Extract roof measurements from the report"""
         
+        # Line lengths - one pass; the first occurrence of each label wins
+        found: Dict[str, Any] = {}
+        for m in _RE_ROOF_LINES.finditer(self.text_content):
+            key = m.lastgroup
+            if key in found:
+                continue
+            try:
+                value = m.group(m.lastindex + 1)
+                found[key] = float(value.replace(",", "")) if "," in value else float(value)
+            except ValueError:
+                found[key] = None
+            if len(found) == 8:
+                break
+        
         # Total roof area
-        total_area = self._extract_number(r'Total\s+(?:Roof\s+)?Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+        total_area = self._extract_number(_RE_TOTAL_AREA, self._text_lower)
         if not total_area:
-            total_area = self._extract_number(r'Total\s+Area\s*\(All\s+Pitches\)\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+            total_area = self._extract_number(_RE_TOTAL_AREA_ALL_PITCHES, self._text_lower)
+        found['total_area_sqft'] = total_area
         
         # Total facets
-        total_facets = self._extract_number(r'Total\s+(?:Roof\s+)?Facets\s*[=:]\s*(\d+)')
-        
-        # Predominant pitch
-        pitch = self._extract_string(r'Predominant\s+Pitch\s*[=:]\s*(\d+/\d+)')
-        
-        # Number of stories
-        stories = self._extract_string(r'Number\s+of\s+Stories\s*[=:>]\s*([^\n]+)')
-        
-        # Line lengths - use more specific patterns
-        ridges = self._extract_number(r'Ridges?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
+        total_facets = self._extract_number(_RE_TOTAL_FACETS, self._text_lower)
+        found['total_facets'] = int(total_facets) if total_facets else 0
         
-        # Hips - must not match "Ridges/Hips" combined
-        hips_match = re.search(r'(?<!/)\bHips?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft', self.text_content)
-        hips = float(hips_match.group(1).replace(",", "")) if hips_match else 0
-        
-        valleys = self._extract_number(r'Valleys?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        rakes = self._extract_number(r'Rakes?(?:\†)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        eaves = self._extract_number(r'Eaves?(?:/Starter)?(?:\‡)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        flashing = self._extract_number(r'(?<!Step\s)Flashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        step_flashing = self._extract_number(r'Step\s+[Ff]lashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
+        # Predominant pitch and number of stories
+        found['predominant_pitch'] = self._extract_string(_RE_PREDOMINANT_PITCH, self._text_lower)
+        found['num_stories'] = self._extract_string(_RE_STORIES)
         
         # Drip edge - may appear as "Drip Edge (Eaves + Rakes)" or just extraction from eaves + rakes
-        drip_edge_match = re.search(r'Drip\s+Edge\s*\([^)]*\)\s*=\s*([\d,]+(?:\.\d+)?)\s*ft', self.text_content)
-        if drip_edge_match:
-            drip_edge = float(drip_edge_match.group(1).replace(",", ""))
-        else:
+        if found.get('drip_edge_ft') is None:
             # Calculate from eaves + rakes if not explicitly stated
-            drip_edge = (eaves or 0) + (rakes or 0) if (eaves or rakes) else 0
-        
-        # Estimated attic
-        attic = self._extract_number(r'Estimated\s+Attic\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
-        
-        return RoofMeasurements(
-            total_area_sqft=total_area or 0,
-            total_facets=int(total_facets) if total_facets else 0,
-            predominant_pitch=pitch or "",
-            num_stories=stories or "",
-            ridges_ft=ridges or 0,
-            hips_ft=hips,
-            valleys_ft=valleys or 0,
-            rakes_ft=rakes or 0,
-            eaves_ft=eaves or 0,
-            flashing_ft=flashing or 0,
-            step_flashing_ft=step_flashing or 0,
-            drip_edge_ft=drip_edge or 0,
-            estimated_attic_sqft=attic
-        )
+            eaves = found.get('eaves_ft')
+            rakes = found.get('rakes_ft')
+            found['drip_edge_ft'] = (eaves or 0) + (rakes or 0) if (eaves or rakes) else 0
+        
+        # Missing or zero values take the defaults; hips and the estimated
+        # attic are passed through as parsed, except an unparseable hips is 0
+        roof = _ROOF_DEFAULTS | {key: value for key, value in found.items() if value}
+        hips = found.get('hips_ft')
+        roof['hips_ft'] = 0 if hips is None else hips
+        roof['estimated_attic_sqft'] = self._extract_number(_RE_ATTIC, self._text_lower)
+        return RoofMeasurements(**roof)
     
     def parse_wall_measurements(self) -> Optional[WallMeasurements]:
         """Extract wall measurements if present"""
         
-        total_wall = self._extract_number(r'Total\s+Wall\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
-        wall_facets = self._extract_number(r'Total\s+Wall\s+Facets\s*[=:]\s*(\d+)')
-        siding = self._extract_number(r'Total\s+Siding\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
-        masonry = self._extract_number(r'Total\s+Masonry\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
+        total_wall = self._extract_number(_RE_TOTAL_WALL_AREA, self._text_lower)
+        wall_facets = self._extract_number(_RE_TOTAL_WALL_FACETS, self._text_lower)
+        siding = self._extract_number(_RE_TOTAL_SIDING_AREA, self._text_lower)
+        masonry = self._extract_number(_RE_TOTAL_MASONRY_AREA, self._text_lower)
         
         if total_wall or siding or masonry:
             return WallMeasurements(
@@ -253,32 +496,32 @@ class EagleViewParser:
         
         # Look for the pitch table pattern
         # Format: Roof Pitches | 3/12 | 6/12 | 9/12 etc
-        pitch_section = re.search(
-            r'Areas?\s+per\s+Pitch.*?Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*Roof\s*([\d.%\s]+)',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        pitch_section = _RE_PITCH_SECTION.search(self._summary_lower)
         
         if pitch_section:
-            pitch_values = re.findall(r'(\d+/\d+)', pitch_section.group(1))
-            area_values = re.findall(r'([\d,]+\.?\d*)', pitch_section.group(2))
-            percent_values = re.findall(r'([\d.]+)%?', pitch_section.group(3))
-            
-            for i, pitch in enumerate(pitch_values):
-                if i < len(area_values) and i < len(percent_values):
-                    try:
-                        area = float(area_values[i].replace(",", ""))
-                        pct = float(percent_values[i])
-                        pitches.append(PitchBreakdown(
-                            pitch=pitch,
-                            area_sqft=area,
-                            percent_of_roof=pct
-                        ))
-                    except ValueError:
-                        continue
+            pitches = self._pitch_rows(pitch_section)
         
         return pitches
     
+    def _pitch_rows(self, pitch_section) -> List[PitchBreakdown]:
+        """Build PitchBreakdown rows from a matched Roof Pitches / Area / % of Roof table"""
+        pitches = []
+        # The three rows are walked in lockstep; zip stops at the shortest one
+        for pitch_m, area_m, pct_m in zip(_RE_PITCH_VALUE.finditer(pitch_section.group(1)),
+                                          _RE_AREA_VALUE.finditer(pitch_section.group(2)),
+                                          _RE_PERCENT_VALUE.finditer(pitch_section.group(3))):
+            try:
+                area = float(area_m.group(1).replace(",", ""))
+                pct = float(pct_m.group(1))
+                pitches.append(PitchBreakdown(
+                    pitch=pitch_m.group(1),
+                    area_sqft=area,
+                    percent_of_roof=pct
+                ))
+            except ValueError:
+                continue
+        return pitches
+    
     def parse_waste_calculations(self) -> Tuple[List[WasteCalculation], Optional[WasteCalculation]]:
         """Extract waste calculation table and identify suggested waste"""
         waste_calcs = []
@@ -287,39 +530,23 @@ class EagleViewParser:
         # Look for waste calculation table
         # Pattern: Waste % | 0% | 5% | 8% | 10% ...
         # The table has "Measured" under 0% and "Suggested" under the recommended percentage
-        waste_section = re.search(
-            r'Waste\s*%\s*([\d%\s]+)\s*Area\s*\(Sq\s*ft\)\s*([\d,\s]+)\s*Squares\s*\*?\s*([\d.\s]+)(?:.*?(Measured))?(?:.*?(Suggested))?',
-            self.text_content,
-            re.IGNORECASE | re.DOTALL
-        )
+        waste_section = _RE_WASTE_SECTION.search(self._summary_lower)
         
         if waste_section:
-            pct_values = re.findall(r'(\d+)%?', waste_section.group(1))
-            area_values = re.findall(r'(\d+)', waste_section.group(2))
-            sq_values = re.findall(r'([\d.]+)', waste_section.group(3))
+            pct_values = _RE_WASTE_PCT_VALUE.findall(waste_section.group(1))
+            area_values = _RE_INTEGER_VALUE.findall(waste_section.group(2))
+            sq_values = _RE_DECIMAL_VALUE.findall(waste_section.group(3))
             
             # Determine suggested waste percentage
             # EagleView typically marks one column as "Suggested" - usually 10% for normal complexity
             # Look for explicit "Suggested" marker position or use the bolded/highlighted one
             suggested_pct = None
             
-            # Check if there's explicit text indicating suggested percentage
-            suggested_match = re.search(
-                r'(\d+)%\s*\n?\s*Area.*?Suggested|Suggested.*?(\d+)%',
-                self.text_content,
-                re.IGNORECASE | re.DOTALL
-            )
-            
             # In most EagleView reports, 10% is suggested for normal complexity
             # The pattern shows columns with "Measured" under 0% and "Suggested" typically under 10%
-            # Count position of "Suggested" label if it appears after the table
-            full_waste_section = re.search(
-                r'Waste\s*%\s*([\d%\s]+).*?Measured\s*(Suggested)?',
-                self.text_content,
-                re.IGNORECASE | re.DOTALL
-            )
+            full_waste_section = _RE_FULL_WASTE_SECTION.search(self._summary_text)
             
-            if full_waste_section and 'Suggested' in self.text_content:
+            if full_waste_section and 'Suggested' in self._summary_text:
                 # Find which column has the suggested marker
                 # Typically it's the 4th column (index 3) which is 10%
                 # But let's check if 10% exists in the values
@@ -352,39 +579,35 @@ class EagleViewParser:
         
         return waste_calcs, suggested_waste
     
-    def _parse_structure_waste(self, structure_text: str) -> Tuple[List[WasteCalculation], Optional[WasteCalculation]]:
+    def _pitch_numerators(self, structure_text: str) -> List[int]:
+        """Rise of each pitch (the N in N/12) listed in a structure's Roof Pitches row"""
+        pitch_section = _RE_STRUCT_PITCH_LIST.search(structure_text)
+        if not pitch_section:
+            return []
+        return [int(n) for n in _RE_PITCH_RISE.findall(pitch_section.group(1))]
+    
+    def _parse_structure_waste(self, structure_text: str,
+                               pitch_numerators: Optional[List[int]] = None) -> Tuple[List[WasteCalculation], Optional[WasteCalculation]]:
         """Parse waste calculations for a single structure section"""
         waste_calcs = []
         suggested_waste = None
         
         # Look for the waste table pattern
-        waste_section = re.search(
-            r'Waste\s*%\s*([\d%\s]+)\s*Area\s*\(Sq\s*ft\)\s*([\d,\s]+)\s*Squares\s*\*?\s*([\d.\s]+)',
-            structure_text,
-            re.IGNORECASE
-        )
+        waste_section = _RE_STRUCT_WASTE_SECTION.search(structure_text)
         
         if waste_section:
-            pct_values = re.findall(r'(\d+)%?', waste_section.group(1))
-            area_values = re.findall(r'(\d+)', waste_section.group(2))
-            sq_values = re.findall(r'([\d.]+)', waste_section.group(3))
+            pct_values = _RE_WASTE_PCT_VALUE.findall(waste_section.group(1))
+            area_values = _RE_INTEGER_VALUE.findall(waste_section.group(2))
+            sq_values = _RE_DECIMAL_VALUE.findall(waste_section.group(3))
             
             # Determine complexity based on pitch analysis (not text parsing)
-            pitch_section = re.search(
-                r'Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)',
-                structure_text,
-                re.IGNORECASE
-            )
-            
-            pitches_in_section = []
-            if pitch_section:
-                pitches_in_section = re.findall(r'(\d+)/12', pitch_section.group(1))
+            if pitch_numerators is None:
+                pitch_numerators = self._pitch_numerators(structure_text)
             
             # Determine complexity based on pitches
-            steep_pitches = [int(p) for p in pitches_in_section if int(p) >= 12]
-            has_steep = len(steep_pitches) > 0
-            num_unique_pitches = len(set(pitches_in_section))
-            has_high_pitch = any(int(p) >= 10 for p in pitches_in_section)
+            has_steep = any(n >= 12 for n in pitch_numerators)
+            num_unique_pitches = len(set(pitch_numerators))
+            has_high_pitch = any(n >= 10 for n in pitch_numerators)
             
             # Determine suggested index based on complexity
             # EagleView standard waste columns: 0%, 3%, 8%, 13%, 16%, 18%, 20%, 23%, 28%
@@ -441,75 +664,51 @@ class EagleViewParser:
         pitches = []
         
         # Look for pitch table in structure section
-        pitch_section = re.search(
-            r'Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*Roof\s*([\d.%\s]+)',
-            structure_text,
-            re.IGNORECASE
-        )
+        pitch_section = _RE_STRUCT_PITCH_SECTION.search(structure_text)
         
         if pitch_section:
-            pitch_values = re.findall(r'(\d+/\d+)', pitch_section.group(1))
-            area_values = re.findall(r'([\d,]+\.?\d*)', pitch_section.group(2))
-            percent_values = re.findall(r'([\d.]+)%?', pitch_section.group(3))
-            
-            for i, pitch in enumerate(pitch_values):
-                if i < len(area_values) and i < len(percent_values):
-                    try:
-                        area = float(area_values[i].replace(",", ""))
-                        pct = float(percent_values[i])
-                        pitches.append(PitchBreakdown(
-                            pitch=pitch,
-                            area_sqft=area,
-                            percent_of_roof=pct
-                        ))
-                    except ValueError:
-                        continue
+            pitches = self._pitch_rows(pitch_section)
         
         return pitches
     
     def parse_structures(self) -> List[Structure]:
         """Parse individual structure data for multi-structure reports"""
         structures = []
+        summary_text = self._summary_text
+        summary_lower = self._summary_lower
         
         # Find REPORT SUMMARY sections with Structure #N headers
         # These contain the waste tables and pitch breakdowns we need
-        report_summary_sections = list(re.finditer(
-            r'REPORT\s+SUMMARY\s*\n\s*Structure\s*#?\s*(\d+)',
-            self.text_content,
-            re.IGNORECASE
-        ))
+        report_summary_sections = list(_RE_REPORT_SUMMARY_STRUCTURE.finditer(summary_lower))
         
         if len(report_summary_sections) < 1:
             # Try alternate pattern - just Structure #N in Report Summary context
-            report_summary_sections = list(re.finditer(
-                r'Structure\s*#?\s*(\d+)\s*\n\s*Areas\s+per\s+Pitch',
-                self.text_content,
-                re.IGNORECASE
-            ))
+            report_summary_sections = list(_RE_STRUCTURE_AREAS_PER_PITCH.finditer(summary_lower))
         
         if len(report_summary_sections) < 1:
             # Single structure report - no need to parse individual structures
             return structures
         
         # Find "All Structures" section position
-        all_structures_match = re.search(r'All\s+Structures\s*\n\s*Areas\s+per\s+Pitch', self.text_content, re.IGNORECASE)
-        all_structures_pos = all_structures_match.start() if all_structures_match else len(self.text_content)
+        all_structures_pos = summary_text.find('All Structures\nAreas per Pitch')
+        if all_structures_pos == -1:
+            # Other capitalisation or spacing
+            all_structures_match = _RE_ALL_STRUCTURES.search(summary_lower)
+            all_structures_pos = all_structures_match.start() if all_structures_match else len(summary_text)
         
         # Parse measurements by structure table if available
         struct_measurements = {}
-        mbs_match = re.search(
-            r'Measurements\s+by\s+Structure.*?Structure.*?Area.*?Ridges.*?\n(.*?)(?:All\s+values|Online)',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        mbs_match = _RE_MBS_SECTION.search(summary_lower)
         
         if mbs_match:
             # Parse each row: Structure Area Ridges Hips Valleys Rakes Eaves Flashing StepFlashing Parapets
-            rows = re.findall(
-                r'(\d+)\s+([\d,]+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)\s+(\d+)',
-                mbs_match.group(1)
-            )
-            for row in rows:
+            for line in mbs_match.group(1).splitlines():
+                # Header lines like "(sq ft) (ft) ..." fail these checks and are skipped
+                row = line.split()
+                if len(row) < 10 or not row[0].isdigit() or not row[1].replace(',', '').isdigit():
+                    continue
+                if not all(value.isdigit() for value in row[2:10]):
+                    continue
                 struct_num = int(row[0])
                 struct_measurements[struct_num] = {
                     'area': float(row[1].replace(',', '')),
@@ -534,38 +733,33 @@ class EagleViewParser:
             else:
                 end_pos = all_structures_pos
             
-            struct_text = self.text_content[start_pos:end_pos]
+            struct_text = summary_text[start_pos:end_pos]
             
             # Parse structure-specific data
             pitch_breakdown = self._parse_structure_pitches(struct_text)
-            waste_calcs, suggested_waste = self._parse_structure_waste(struct_text)
-            
-            # Detect complexity from the Structure Complexity section
-            complexity = None
-            complexity_section = re.search(r'Structure\s+Complexity\s*(Simple|Normal|Complex)', struct_text, re.IGNORECASE)
-            if complexity_section:
-                # The complexity indicator shows Simple, Normal, Complex - find which is highlighted
-                # Usually the PDF text just lists them but the highlighted one appears differently
-                # For now, parse based on pitches
-                pass
+            pitch_numerators = self._pitch_numerators(struct_text)
+            waste_calcs, suggested_waste = self._parse_structure_waste(struct_text, pitch_numerators)
             
-            # Check for complexity based on steep pitches or multiple varied pitches
-            pitches_in_section = [p.pitch for p in pitch_breakdown]
-            steep_pitches = [p for p in pitches_in_section if int(p.split('/')[0]) >= 12]
-            if steep_pitches:
+            # Complexity based on steep pitches or multiple varied pitches in the
+            # parsed breakdown; the raw Roof Pitches row only feeds the waste heuristic
+            if any(int(p.pitch.split('/')[0]) >= 12 for p in pitch_breakdown):
                 complexity = "Complex"
-            elif len(set(pitches_in_section)) > 2:
+            elif len({p.pitch for p in pitch_breakdown}) > 2:
                 complexity = "Normal"
             else:
                 complexity = "Simple"
             
-            # Get predominant pitch
-            pred_pitch_match = re.search(r'Predominant\s+Pitch\s*[=:]\s*(\d+/\d+)', struct_text)
-            predominant_pitch = pred_pitch_match.group(1) if pred_pitch_match else ""
-            
-            # Get total facets for this structure
-            facets_match = re.search(r'Total\s+Roof\s+Facets\s*[=:]\s*(\d+)', struct_text)
-            total_facets = int(facets_match.group(1)) if facets_match else 0
+            # Pitch, facets, area and line lengths in one pass over the section;
+            # the first occurrence of each label wins
+            fields: Dict[str, str] = {}
+            for m in _RE_STRUCT_FIELDS.finditer(struct_text):
+                key = m.lastgroup
+                if key not in fields:
+                    fields[key] = m.group(m.lastindex + 1)
+                    if len(fields) == 10:
+                        break
+            predominant_pitch = fields.get('predominant_pitch', "")
+            total_facets = int(fields['facets']) if 'facets' in fields else 0
             
             # Get area from struct_measurements or parse from text
             if struct_num in struct_measurements:
@@ -580,29 +774,11 @@ class EagleViewParser:
                 step_flashing = meas['step_flashing']
             else:
                 # Parse from structure text
-                area_match = re.search(r'Total\s+Area\s*\(All\s+Pitches\)\s*[=:]\s*([\d,]+)', struct_text)
-                total_area = float(area_match.group(1).replace(',', '')) if area_match else 0
-                
-                ridges_match = re.search(r'Ridges\s*[=:]\s*(\d+)', struct_text)
-                ridges = float(ridges_match.group(1)) if ridges_match else 0
-                
-                hips_match = re.search(r'(?<!/)\bHips?\s*[=:]\s*(\d+)', struct_text)
-                hips = float(hips_match.group(1)) if hips_match else 0
-                
-                valleys_match = re.search(r'Valleys\s*[=:]\s*(\d+)', struct_text)
-                valleys = float(valleys_match.group(1)) if valleys_match else 0
-                
-                rakes_match = re.search(r'Rakes\s*[=:]\s*(\d+)', struct_text)
-                rakes = float(rakes_match.group(1)) if rakes_match else 0
-                
-                eaves_match = re.search(r'Eaves\s*[=:]\s*(\d+)', struct_text)
-                eaves = float(eaves_match.group(1)) if eaves_match else 0
-                
-                flashing_match = re.search(r'(?<!Step\s)Flashing\s*[=:]\s*(\d+)', struct_text)
-                flashing = float(flashing_match.group(1)) if flashing_match else 0
-                
-                step_flashing_match = re.search(r'Step\s*flashing\s*[=:]\s*(\d+)', struct_text)
-                step_flashing = float(step_flashing_match.group(1)) if step_flashing_match else 0
+                total_area = float(fields['area'].replace(',', '')) if 'area' in fields else 0
+                ridges, hips, valleys, rakes, eaves, flashing, step_flashing = (
+                    float(fields[key]) if key in fields else 0
+                    for key in ('ridges', 'hips', 'valleys', 'rakes', 'eaves', 'flashing', 'step_flashing')
+                )
             
             structure = Structure(
                 structure_number=struct_num,
@@ -632,10 +808,7 @@ class EagleViewParser:
         
         # Find all window/door entries in the text
         # Pattern matches: I1 10.0 14.0 2.0 x 5.0
-        all_entries = re.findall(
-            r'([A-Z]\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*x\s*([\d.]+)',
-            self.text_content
-        )
+        all_entries = _RE_WD_ENTRY.findall(self.text_content)
         
         # In EagleView reports, window/door labels have prefixes that correspond to wall labels
         # We can map them based on the Elevation diagrams or the wall area diagram
@@ -648,56 +821,57 @@ class EagleViewParser:
         # Get direction mapping from the window/door section
         direction_map = {}
         
-        # Parse each direction's entries from the elevation diagrams or window/door tables
-        wd_sections = re.findall(
-            r'(North|East|South|West)\s+(?:East|South|West|North)?\s*(?:Window/Door|Perimeter|Siding).*?(?=(?:North|East|South|West|Total\s+[\d,]+\s+[\d.]+|PAGE|\Z))',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
-        
-        # Alternative: find direction associations from elevation summaries
+        # Find direction associations from elevation summaries
         # Pattern: Wall | Siding | Masonry | Window & Door Area | etc with direction headers
+        elevation_starts = {}
+        for m in _RE_ELEVATION_HEADING.finditer(self._text_lower):
+            elevation_starts.setdefault(m.group(1).title(), m.start())
+        # Applied in a fixed order so a later direction overwrites an earlier one
         for direction in ['North', 'East', 'South', 'West']:
-            # Find this direction's window/door entries in elevation diagrams
-            elev_pattern = rf'{direction}\s+ELEVATION.*?Window\s*&\s*Door.*?Count\s*(.*?)(?=(?:Note:|©|\Z))'
-            elev_match = re.search(elev_pattern, self.text_content, re.DOTALL | re.IGNORECASE)
+            start = elevation_starts.get(direction)
+            if start is None:
+                continue
+            elev_match = _RE_ELEVATION_TABLE.match(self.text_content, start)
             
             if elev_match:
                 section_text = elev_match.group(1)
                 # Find wall labels in this section
-                wall_labels = re.findall(r'\b([A-Z])\s+[\d.]+\s+[\d.]+', section_text)
+                wall_labels = _RE_WALL_LABEL.findall(section_text)
                 for label in wall_labels:
                     direction_map[label] = direction
         
         # Also try to extract from the window/door table directly
-        wd_section = re.search(
-            r'WINDOW\s+AND\s+DOOR\s+DIAGRAM.*?(?=ELEVATION|REPORT\s+SUMMARY|\Z)',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        # Locate the heading literally and only use the regex for unusual spacing
+        heading = 'window and door diagram'
+        start = self._text_lower.find(heading)
+        if start != -1:
+            end_match = _RE_WD_DIAGRAM_END.search(self.text_content, start + len(heading))
+            wd_text = self.text_content[start:end_match.start() if end_match else len(self.text_content)]
+        else:
+            wd_section = _RE_WD_DIAGRAM.search(self.text_content)
+            wd_text = wd_section.group(0) if wd_section else None
         
-        if wd_section:
-            wd_text = wd_section.group(0)
-            
+        if wd_text is not None:
             # Look for entries grouped by direction
             # The table shows directions as headers
             current_direction = None
-            lines = wd_text.split('\n')
+            line_end = -1
             
-            for line in lines:
+            for m in _RE_WD_SCAN.finditer(wd_text):
                 # Check for direction markers
-                dir_match = re.match(r'^(North|East|South|West)\b', line, re.IGNORECASE)
-                if dir_match:
-                    current_direction = dir_match.group(1).title()
+                if m.group('dir'):
+                    current_direction = m.group('dir').title()
+                    continue
                 
-                # Look for window/door entries
-                entry_match = re.search(r'([A-Z]\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*x\s*([\d.]+)', line)
-                if entry_match and current_direction:
-                    label = entry_match.group(1)
+                # Only the first window/door entry on each line counts
+                if m.start() < line_end:
+                    continue
+                line_end = wd_text.find('\n', m.start())
+                if line_end == -1:
+                    line_end = len(wd_text)
+                if current_direction:
                     # Map the wall letter to this direction
-                    wall_letter = label[0]
-                    if wall_letter not in direction_map:
-                        direction_map[wall_letter] = current_direction
+                    direction_map.setdefault(m.group('lbl')[0], current_direction)
         
         # Now create WindowDoor objects using the direction mapping
         seen_labels = set()
@@ -726,12 +900,63 @@ class EagleViewParser:
     
     def parse_coordinates(self) -> Dict[str, Optional[float]]:
         """Extract GPS coordinates"""
-        lat = self._extract_number(r'Latitude\s*[=:]\s*([-\d.]+)')
-        lon = self._extract_number(r'Longitude\s*[=:]\s*([-\d.]+)')
+        lat = self._extract_number(_RE_LATITUDE, self._summary_lower)
+        lon = self._extract_number(_RE_LONGITUDE, self._summary_lower)
         return {"latitude": lat, "longitude": lon}
     
+    def _cache_path(self) -> str:
+        """Cache file for this PDF, keyed by a SHA-256 of its bytes"""
+        with open(self.pdf_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                digest = hashlib.file_digest(f, 'sha256').hexdigest()
+            else:
+                sha = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    sha.update(chunk)
+                digest = sha.hexdigest()
+        return os.path.join(self.cache_dir, f"v{_CACHE_VERSION}-{digest}.pkl")
+    
+    def _load_cached(self, cache_path: str) -> Optional[EagleViewReport]:
+        """Load a previously parsed report, or None if there is no usable cache entry"""
+        try:
+            with open(cache_path, 'rb') as f:
+                report = pickle.load(f)
+        except Exception:
+            # Missing, truncated or written by an incompatible version
+            return None
+        return report if isinstance(report, EagleViewReport) else None
+    
+    def _store_cached(self, cache_path: str, report: EagleViewReport):
+        """Write a parsed report to the cache; failures only cost a reparse later"""
+        tmp_path = None
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial pickle
+            with tempfile.NamedTemporaryFile('wb', dir=self.cache_dir, delete=False) as tmp:
+                tmp_path = tmp.name
+                pickle.dump(report, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            # Unwritable directory, full disk or an unpicklable report; the
+            # parse itself succeeded, so don't fail it or leave the temp file behind
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+    
     def parse(self) -> EagleViewReport:
-        """Parse the complete EagleView report"""
+        """Parse the complete EagleView report
+        
+        With a cache_dir, a report already parsed from identical PDF bytes is
+        loaded from the cache instead, and the text is not extracted.
+        """
+        cache_path = self._cache_path() if self.cache_dir else None
+        if cache_path:
+            report = self._load_cached(cache_path)
+            if report is not None:
+                return report
+        
         self.extract_text()
         
         property_info = self.parse_property_info()
@@ -743,7 +968,7 @@ class EagleViewParser:
         coords = self.parse_coordinates()
         structures = self.parse_structures()
         
-        return EagleViewReport(
+        report = EagleViewReport(
             address=property_info["address"],
             report_number=property_info["report_number"],
             report_date=property_info["report_date"],
@@ -759,9 +984,16 @@ class EagleViewParser:
             latitude=coords["latitude"],
             longitude=coords["longitude"]
         )
+        if cache_path:
+            self._store_cached(cache_path, report)
+        return report
     
     def to_dict(self, report: EagleViewReport) -> Dict[str, Any]:
         """Convert report to dictionary"""
+        return self._build_dict(report, _fields_dict)
+    
+    def _build_dict(self, report: EagleViewReport, row: Callable[[Any], Any]) -> Dict[str, Any]:
+        """Lay out the report dict, passing each row dataclass through row()"""
         result = {
             "property": {
                 "address": report.address,
@@ -774,12 +1006,12 @@ class EagleViewParser:
                 "prepared_for_contact": report.prepared_for_contact,
                 "prepared_for_company": report.prepared_for_company
             },
-            "roof_measurements": asdict(report.roof),
-            "wall_measurements": asdict(report.walls) if report.walls else None,
-            "pitch_breakdown": [asdict(p) for p in report.pitch_breakdown],
-            "suggested_waste": asdict(report.suggested_waste) if report.suggested_waste else None,
-            "all_waste_calculations": [asdict(w) for w in report.waste_calculations],
-            "windows_doors": [asdict(wd) for wd in report.windows_doors]
+            "roof_measurements": row(report.roof),
+            "wall_measurements": row(report.walls) if report.walls else None,
+            "pitch_breakdown": [row(p) for p in report.pitch_breakdown],
+            "suggested_waste": row(report.suggested_waste) if report.suggested_waste else None,
+            "all_waste_calculations": [row(w) for w in report.waste_calculations],
+            "windows_doors": [row(wd) for wd in report.windows_doors]
         }
         
         # Add structures if present (multi-structure reports)
@@ -802,9 +1034,9 @@ class EagleViewParser:
                         "step_flashing_ft": struct.step_flashing_ft,
                         "drip_edge_ft": struct.drip_edge_ft
                     },
-                    "pitch_breakdown": [asdict(p) for p in struct.pitch_breakdown],
-                    "suggested_waste": asdict(struct.suggested_waste) if struct.suggested_waste else None,
-                    "all_waste_calculations": [asdict(w) for w in struct.waste_calculations]
+                    "pitch_breakdown": [row(p) for p in struct.pitch_breakdown],
+                    "suggested_waste": row(struct.suggested_waste) if struct.suggested_waste else None,
+                    "all_waste_calculations": [row(w) for w in struct.waste_calculations]
                 }
                 result["structures"].append(struct_dict)
         
@@ -812,29 +1044,38 @@ class EagleViewParser:
     
     def to_json(self, report: EagleViewReport, indent: int = 2) -> str:
         """Convert report to JSON string"""
-        return json.dumps(self.to_dict(report), indent=indent)
+        # Rows stay dataclasses and are encoded by _json_default during the
+        # dump, so no intermediate dict is built for each of them
+        return json.dumps(self._build_dict(report, lambda obj: obj), indent=indent, default=_json_default)
+    
+    def to_json_file(self, report: EagleViewReport, path: str, indent: int = 2):
+        """Write report JSON straight to a file without building the full string first"""
+        with open(path, 'w') as f:
+            json.dump(self._build_dict(report, lambda obj: obj), f, indent=indent, default=_json_default)
 
 
 def main():
     import sys
     
-    if len(sys.argv) < 2:
-        print("Usage: python eagleview_parser.py <pdf_path> [output_json]")
+    # --cache reuses reports parsed earlier from the same PDF bytes
+    args = [arg for arg in sys.argv[1:] if arg != "--cache"]
+    cache_dir = DEFAULT_CACHE_DIR if len(args) < len(sys.argv) - 1 else None
+    
+    if len(args) < 1:
+        print("Usage: python eagleview_parser.py [--cache] <pdf_path> [output_json]")
         sys.exit(1)
     
-    pdf_path = sys.argv[1]
-    output_path = sys.argv[2] if len(sys.argv) > 2 else None
+    pdf_path = args[0]
+    output_path = args[1] if len(args) > 1 else None
     
-    parser = EagleViewParser(pdf_path)
+    parser = EagleViewParser(pdf_path, cache_dir=cache_dir)
     report = parser.parse()
-    json_output = parser.to_json(report)
     
     if output_path:
-        with open(output_path, 'w') as f:
-            f.write(json_output)
+        parser.to_json_file(report, output_path)
         print(f"Report saved to {output_path}")
     else:
-        print(json_output)
+        print(parser.to_json(report))
 
 
 if __name__ == "__main__":
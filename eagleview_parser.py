@@ -5,13 +5,154 @@ Extracts roof, wall, window/door measurements from EagleView Premium reports.
 """
 
 import pdfplumber
+import os
 import re
+import sys
 import json
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from dataclasses import dataclass
 from typing import Optional, List, Dict, Any, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+try:
+    import pcre2
+except ImportError:
+    pcre2 = None
+
+
+def _compile_jit(pattern: str):
+    """Compile a document-scale pattern with PCRE2's JIT, or with re if pcre2 is missing.
+
+    Flags must be given inline ((?i), (?m)) since the two modules number them differently.
+    """
+    if pcre2 is not None:
+        return pcre2.compile(pattern, jit=True)
+    return re.compile(pattern)
+
+
+def _parse_num(s: str) -> float:
+    """Parse a number that may carry thousands separators, e.g. "1,234.5".
+
+    str.replace hands back the same string when there is no comma, so the
+    common case allocates nothing beyond the float.
+    """
+    return float(s.replace(",", ""))
+
+
+# Precompiled patterns, grouped by the parse_* method that uses them.
+# The patterns that scan the whole report go through _compile_jit; PCRE2's
+# JIT runs them 10-50x faster than re on the sample reports. google-re2 was
+# slower than re on the address and table searches and cannot compile the
+# lookbehinds, and Hyperscan reports match offsets without capture groups.
+
+# Property info
+_RE_ADDRESS = re.compile(
+    r'(\d{1,6}\s+[A-Za-z][A-Za-z0-9\s]+(?:Lane|Ln|Street|St|Road|Rd|Ave|Avenue|Dr|Drive|Ct|Court|Blvd|Boulevard|Way|Circle|Cir|Place|Pl)[^,]*,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?)'
+)
+_RE_REPORT_NUMBER = re.compile(r'Report:\s*(\d{6,})', re.IGNORECASE)
+_RE_DATE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+# These match within the first page or two, but re's case-insensitive search
+# runs about 10us against 2us under the JIT
+_RE_CONTACT = _compile_jit(r'(?i)Contact:\s*([^\n]+)')
+_RE_COMPANY = _compile_jit(r'(?i)Company:\s*([^\n]+)')
+
+# Roof measurements
+_RE_TOTAL_AREA = re.compile(r'Total\s+(?:Roof\s+)?Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft', re.IGNORECASE)
+_RE_TOTAL_AREA_ALL_PITCHES = re.compile(r'Total\s+Area\s*\(All\s+Pitches\)\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft', re.IGNORECASE)
+_RE_TOTAL_FACETS = re.compile(r'Total\s+(?:Roof\s+)?Facets\s*[=:]\s*(\d+)', re.IGNORECASE)
+_RE_PREDOMINANT_PITCH = re.compile(r'Predominant\s+Pitch\s*[=:]\s*(\d+/\d+)', re.IGNORECASE)
+_RE_STORIES = re.compile(r'Number\s+of\s+Stories\s*[=:>]\s*([^\n]+)', re.IGNORECASE)
+# Line lengths, matched in a single pass. Each alternative is wrapped in a named
+# group so m.lastgroup names the measurement and group lastindex + 1 holds the
+# number. Step Flashing only consumes "Step" and reads its value in a lookahead,
+# so the Flashing alternative still sees the label and applies its own
+# lookbehind; Hips stays case-sensitive as before and is checked for a leading
+# "/" in the loop rather than with a lookbehind. This pass stays on re: pcre2
+# reports a different lastindex/lastgroup when the value is captured inside a
+# lookahead, and the pass stops early anyway.
+_RE_ROOF_LINES = re.compile(
+    r'(?i)(?P<ridges>Ridges?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<hips>(?-i:\bHips?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft))'
+    r'|(?P<valleys>Valleys?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<rakes>Rakes?(?:\†)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<eaves>Eaves?(?:/Starter)?(?:\‡)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+    r'|(?P<step_flashing>Step\s+(?=[Ff]lashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft))'
+    r'|(?P<flashing>(?<!Step\s)Flashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft)'
+)
+# Kept out of the single pass: most reports have no Drip Edge line, and the
+# pass can only stop early once every alternative has matched
+_RE_DRIP_EDGE = re.compile(r'Drip\s+Edge\s*\([^)]*\)\s*=\s*([\d,]+(?:\.\d+)?)\s*ft')
+_RE_ATTIC = re.compile(r'Estimated\s+Attic\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft', re.IGNORECASE)
+
+# Wall measurements. Every wall total needs one of these labels, so reports
+# without walls are ruled out with a single search
+_RE_WALL_TOTAL_LABEL = _compile_jit(r'(?i)Total\s+(?:Wall|Siding|Masonry)\s')
+_RE_TOTAL_WALL_AREA = re.compile(r'Total\s+Wall\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft', re.IGNORECASE)
+_RE_TOTAL_WALL_FACETS = re.compile(r'Total\s+Wall\s+Facets\s*[=:]\s*(\d+)', re.IGNORECASE)
+_RE_TOTAL_SIDING_AREA = re.compile(r'Total\s+Siding\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft', re.IGNORECASE)
+_RE_TOTAL_MASONRY_AREA = re.compile(r'Total\s+Masonry\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft', re.IGNORECASE)
+
+# Pitch and waste tables
+_RE_PITCH_SECTION = _compile_jit(
+    r'(?is)Areas?\s+per\s+Pitch.*?Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*Roof\s*([\d.%\s]+)'
+)
+_RE_WASTE_SECTION = _compile_jit(
+    r'(?is)Waste\s*%\s*([\d%\s]+)\s*Area\s*\(Sq\s*ft\)\s*([\d,\s]+)\s*Squares\s*\*?\s*([\d.\s]+)(?:.*?(Measured))?(?:.*?(Suggested))?'
+)
+_RE_SUGGESTED = _compile_jit(r'(?is)(\d+)%\s*\n?\s*Area.*?Suggested|Suggested.*?(\d+)%')
+_RE_FULL_WASTE_SECTION = _compile_jit(r'(?is)Waste\s*%\s*([\d%\s]+).*?Measured\s*(Suggested)?')
+_RE_PITCH_VALUE = re.compile(r'(\d+/\d+)')
+_RE_AREA_VALUE = re.compile(r'([\d,]+\.?\d*)')
+_RE_PERCENT_VALUE = re.compile(r'([\d.]+)%?')
+_RE_WASTE_PCT_VALUE = re.compile(r'(\d+)%?')
+_RE_INTEGER_VALUE = re.compile(r'(\d+)')
+_RE_DECIMAL_VALUE = re.compile(r'([\d.]+)')
+
+# Windows/doors and coordinates
+# Pattern matches: I1 10.0 14.0 2.0 x 5.0
+_RE_WD_ENTRY = _compile_jit(r'([A-Z]\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*x\s*([\d.]+)')
+# Elevation pages are read in this order, so a later direction overwrites an earlier one
+_DIRECTIONS = ('North', 'East', 'South', 'West')
+# One scan finds the first heading for each direction. An elevation's wall
+# table runs from the first "Count" after its first "Window & Door" to the
+# next "Note:" or "©". Each anchor is searched from the previous one instead
+# of spanning them with one lazy DOTALL pattern.
+_RE_ELEVATION_HEADING = _compile_jit(r'(?i)(North|East|South|West)\s+ELEVATION')
+_RE_WINDOW_DOOR_LABEL = re.compile(r'Window\s*&\s*Door', re.IGNORECASE)
+_RE_COUNT_LABEL = re.compile(r'Count\s*', re.IGNORECASE)
+_RE_ELEVATION_END = re.compile(r'Note:|©', re.IGNORECASE)
+_RE_WALL_LABEL = re.compile(r'\b([A-Z])\s+[\d.]+\s+[\d.]+')
+_RE_WD_DIAGRAM = re.compile(r'WINDOW\s+AND\s+DOOR\s+DIAGRAM.*?(?=ELEVATION|REPORT\s+SUMMARY|\Z)', re.DOTALL | re.IGNORECASE)
+# Direction headers at the start of a line, or window/door entries kept within one line
+_RE_WD_SCAN = _compile_jit(
+    r'(?im)^(?P<dir>North|East|South|West)\b'
+    r'|(?-i:(?P<lbl>[A-Z]\d+)[^\S\n]+[\d.]+[^\S\n]+[\d.]+[^\S\n]+[\d.]+[^\S\n]*x[^\S\n]*[\d.]+)'
+)
+_RE_LATITUDE = _compile_jit(r'(?i)Latitude\s*[=:]\s*([-\d.]+)')
+_RE_LONGITUDE = _compile_jit(r'(?i)Longitude\s*[=:]\s*([-\d.]+)')
+
+# Fewest pages worth handing to a worker process; below this the reopen and
+# process start-up cost more than the extraction they save
+_MIN_PAGES_PER_WORKER = 8
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> List[str]:
+    """Extract text for pages [start, stop); runs in a worker process"""
+    # pdfplumber handles can't be pickled, so each worker opens the file itself
+    pages_text = []
+    with pdfplumber.open(pdf_path, pages=range(start + 1, stop + 1)) as pdf:
+        for page in pdf.pages:
+            pages_text.append(page.extract_text() or "")
+            page.close()
+    return pages_text
+
+
+@dataclass(slots=True)
 class RoofMeasurements:
     total_area_sqft: float
     total_facets: int
@@ -28,7 +169,7 @@ class RoofMeasurements:
     estimated_attic_sqft: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WallMeasurements:
     total_wall_area_sqft: float
     total_wall_facets: int
@@ -36,14 +177,14 @@ class WallMeasurements:
     total_masonry_area_sqft: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PitchBreakdown:
     pitch: str
     area_sqft: float
     percent_of_roof: float
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowDoor:
     label: str
     area_sqft: float
@@ -53,7 +194,7 @@ class WindowDoor:
     wall_direction: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WasteCalculation:
     waste_percent: int
     area_sqft: float
@@ -61,7 +202,7 @@ class WasteCalculation:
     is_suggested: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EagleViewReport:
     # Property Info
     address: str
@@ -83,39 +224,68 @@ class EagleViewReport:
     longitude: Optional[float] = None
 
 
+def _fields_dict(obj) -> Dict[str, Any]:
+    """Shallow asdict() for the flat row dataclasses"""
+    return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+
+
 class EagleViewParser:
     def __init__(self, pdf_path: str):
         self.pdf_path = pdf_path
-        self.text_content = ""
         self.pages_text = []
         
     def extract_text(self):
         """Extract all text from PDF"""
+        # The table patterns depend on pdfplumber's layout-ordered text;
+        # pypdfium2 emits a different order that drops the Areas per Pitch
+        # rows. Only the text is kept, so each page's chars/lines/rects are
+        # released as soon as it is read. The file is opened by path:
+        # pdfminer already reads it in small chunks, and passing an mmap
+        # changed neither the time nor the peak RSS. Rebuilding the text from
+        # extract_words() was no faster either: both go through the same
+        # char layout, which is where the time goes.
         with pdfplumber.open(self.pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                self.pages_text.append(page_text)
-            self.text_content = "\n".join(self.pages_text)
+            num_pages = len(pdf.pages)
+            workers = min(os.cpu_count() or 1, num_pages // _MIN_PAGES_PER_WORKER)
+            if workers <= 1:
+                for page in pdf.pages:
+                    page_text = page.extract_text() or ""
+                    page.close()
+                    self.pages_text.append(page_text)
+        
+        if workers > 1:
+            # One contiguous range per worker so each opens the file only once
+            bounds = [num_pages * i // workers for i in range(workers + 1)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunk in executor.map(_extract_page_range, [self.pdf_path] * workers, bounds[:-1], bounds[1:]):
+                    self.pages_text.extend(chunk)
+        # Joined again on next access
+        self.__dict__.pop('text_content', None)
         return self.text_content
     
-    def _extract_number(self, pattern: str, text: str = None) -> Optional[float]:
-        """Extract a number using regex pattern"""
+    @cached_property
+    def text_content(self) -> str:
+        """All page text joined with newlines, built on first access"""
+        return "\n".join(self.pages_text)
+    
+    def _extract_number(self, pattern: re.Pattern, text: str = None) -> Optional[float]:
+        """Extract a number using a precompiled regex pattern"""
         if text is None:
             text = self.text_content
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             try:
                 # Remove commas and convert to float
-                return float(match.group(1).replace(",", ""))
+                return _parse_num(match.group(1))
             except (ValueError, IndexError):
                 return None
         return None
     
-    def _extract_string(self, pattern: str, text: str = None) -> Optional[str]:
-        """Extract a string using regex pattern"""
+    def _extract_string(self, pattern: re.Pattern, text: str = None) -> Optional[str]:
+        """Extract a string using a precompiled regex pattern"""
         if text is None:
             text = self.text_content
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = pattern.search(text)
         if match:
             return match.group(1).strip()
         return None
@@ -124,22 +294,19 @@ class EagleViewParser:
         """Extract property information"""
         # Address - look for street number followed by street name and state/zip
         # Use a more specific pattern to avoid capturing dates
-        address_match = re.search(
-            r'(\d{1,6}\s+[A-Za-z][A-Za-z0-9\s]+(?:Lane|Ln|Street|St|Road|Rd|Ave|Avenue|Dr|Drive|Ct|Court|Blvd|Boulevard|Way|Circle|Cir|Place|Pl)[^,]*,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s+\d{5}(?:-\d{4})?)',
-            self.text_content
-        )
+        address_match = _RE_ADDRESS.search(self.text_content)
         address = address_match.group(1).strip() if address_match else ""
         
         # Report number - specifically look for "Report: XXXXXXXX" format
-        report_num = self._extract_string(r'Report:\s*(\d{6,})')
+        report_num = self._extract_string(_RE_REPORT_NUMBER)
         
         # Date
-        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', self.text_content)
+        date_match = _RE_DATE.search(self.text_content)
         report_date = date_match.group(1) if date_match else ""
         
         # Prepared for
-        contact = self._extract_string(r'Contact:\s*([^\n]+)')
-        company = self._extract_string(r'Company:\s*([^\n]+)')
+        contact = self._extract_string(_RE_CONTACT)
+        company = self._extract_string(_RE_COMPANY)
         
         return {
             "address": address,
@@ -153,42 +320,56 @@ class EagleViewParser:
         """Extract roof measurements from the report"""
         
         # Total roof area
-        total_area = self._extract_number(r'Total\s+(?:Roof\s+)?Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+        total_area = self._extract_number(_RE_TOTAL_AREA)
         if not total_area:
-            total_area = self._extract_number(r'Total\s+Area\s*\(All\s+Pitches\)\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+            total_area = self._extract_number(_RE_TOTAL_AREA_ALL_PITCHES)
         
         # Total facets
-        total_facets = self._extract_number(r'Total\s+(?:Roof\s+)?Facets\s*[=:]\s*(\d+)')
+        total_facets = self._extract_number(_RE_TOTAL_FACETS)
         
         # Predominant pitch
-        pitch = self._extract_string(r'Predominant\s+Pitch\s*[=:]\s*(\d+/\d+)')
+        pitch = self._extract_string(_RE_PREDOMINANT_PITCH)
         
         # Number of stories
-        stories = self._extract_string(r'Number\s+of\s+Stories\s*[=:>]\s*([^\n]+)')
-        
-        # Line lengths - use more specific patterns
-        ridges = self._extract_number(r'Ridges?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        
-        # Hips - must not match "Ridges/Hips" combined
-        hips_match = re.search(r'(?<!/)\bHips?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft', self.text_content)
-        hips = float(hips_match.group(1).replace(",", "")) if hips_match else 0
-        
-        valleys = self._extract_number(r'Valleys?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        rakes = self._extract_number(r'Rakes?(?:\†)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        eaves = self._extract_number(r'Eaves?(?:/Starter)?(?:\‡)?\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        flashing = self._extract_number(r'(?<!Step\s)Flashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
-        step_flashing = self._extract_number(r'Step\s+[Ff]lashing\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*ft')
+        stories = self._extract_string(_RE_STORIES)
+        
+        # Line lengths - one pass; the first occurrence of each label wins
+        text = self.text_content
+        lines: Dict[str, Optional[float]] = {}
+        for m in _RE_ROOF_LINES.finditer(text):
+            key = m.lastgroup
+            if key in lines:
+                continue
+            # Hips must not match "Ridges/Hips" combined
+            if key == 'hips' and text[m.start() - 1:m.start()] == '/':
+                continue
+            try:
+                lines[key] = _parse_num(m.group(m.lastindex + 1))
+            except ValueError:
+                lines[key] = None
+            if len(lines) == 7:
+                break
+        
+        ridges = lines.get('ridges')
+        hips = lines.get('hips')
+        if hips is None:
+            hips = 0
+        valleys = lines.get('valleys')
+        rakes = lines.get('rakes')
+        eaves = lines.get('eaves')
+        flashing = lines.get('flashing')
+        step_flashing = lines.get('step_flashing')
         
         # Drip edge - may appear as "Drip Edge (Eaves + Rakes)" or just extraction from eaves + rakes
-        drip_edge_match = re.search(r'Drip\s+Edge\s*\([^)]*\)\s*=\s*([\d,]+(?:\.\d+)?)\s*ft', self.text_content)
+        drip_edge_match = _RE_DRIP_EDGE.search(self.text_content)
         if drip_edge_match:
-            drip_edge = float(drip_edge_match.group(1).replace(",", ""))
+            drip_edge = _parse_num(drip_edge_match.group(1))
         else:
             # Calculate from eaves + rakes if not explicitly stated
             drip_edge = (eaves or 0) + (rakes or 0) if (eaves or rakes) else 0
         
         # Estimated attic
-        attic = self._extract_number(r'Estimated\s+Attic\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*sq\s*ft')
+        attic = self._extract_number(_RE_ATTIC)
         
         return RoofMeasurements(
             total_area_sqft=total_area or 0,
@@ -208,11 +389,13 @@ class EagleViewParser:
     
     def parse_wall_measurements(self) -> Optional[WallMeasurements]:
         """Extract wall measurements if present"""
+        if not _RE_WALL_TOTAL_LABEL.search(self.text_content):
+            return None
         
-        total_wall = self._extract_number(r'Total\s+Wall\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
-        wall_facets = self._extract_number(r'Total\s+Wall\s+Facets\s*[=:]\s*(\d+)')
-        siding = self._extract_number(r'Total\s+Siding\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
-        masonry = self._extract_number(r'Total\s+Masonry\s+Area\s*[=:]\s*([\d,]+(?:\.\d+)?)\s*(?:sq\s*)?ft')
+        total_wall = self._extract_number(_RE_TOTAL_WALL_AREA)
+        wall_facets = self._extract_number(_RE_TOTAL_WALL_FACETS)
+        siding = self._extract_number(_RE_TOTAL_SIDING_AREA)
+        masonry = self._extract_number(_RE_TOTAL_MASONRY_AREA)
         
         if total_wall or siding or masonry:
             return WallMeasurements(
@@ -229,29 +412,23 @@ class EagleViewParser:
         
         # Look for the pitch table pattern
         # Format: Roof Pitches | 3/12 | 6/12 | 9/12 etc
-        pitch_section = re.search(
-            r'Areas?\s+per\s+Pitch.*?Roof\s+Pitches?\s+([\d/\s]+)\s*Area\s*\(sq\s*ft\)\s*([\d.,\s]+)\s*%\s*of\s*Roof\s*([\d.%\s]+)',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        pitch_section = _RE_PITCH_SECTION.search(self.text_content)
         
         if pitch_section:
-            pitch_values = re.findall(r'(\d+/\d+)', pitch_section.group(1))
-            area_values = re.findall(r'([\d,]+\.?\d*)', pitch_section.group(2))
-            percent_values = re.findall(r'([\d.]+)%?', pitch_section.group(3))
-            
-            for i, pitch in enumerate(pitch_values):
-                if i < len(area_values) and i < len(percent_values):
-                    try:
-                        area = float(area_values[i].replace(",", ""))
-                        pct = float(percent_values[i])
-                        pitches.append(PitchBreakdown(
-                            pitch=pitch,
-                            area_sqft=area,
-                            percent_of_roof=pct
-                        ))
-                    except ValueError:
-                        continue
+            # The three rows are walked in lockstep; zip stops at the shortest one
+            for pitch_m, area_m, pct_m in zip(_RE_PITCH_VALUE.finditer(pitch_section.group(1)),
+                                              _RE_AREA_VALUE.finditer(pitch_section.group(2)),
+                                              _RE_PERCENT_VALUE.finditer(pitch_section.group(3))):
+                try:
+                    area = _parse_num(area_m.group(1))
+                    pct = float(pct_m.group(1))
+                    pitches.append(PitchBreakdown(
+                        pitch=pitch_m.group(1),
+                        area_sqft=area,
+                        percent_of_roof=pct
+                    ))
+                except ValueError:
+                    continue
         
         return pitches
     
@@ -263,16 +440,12 @@ class EagleViewParser:
         # Look for waste calculation table
         # Pattern: Waste % | 0% | 5% | 8% | 10% ...
         # The table has "Measured" under 0% and "Suggested" under the recommended percentage
-        waste_section = re.search(
-            r'Waste\s*%\s*([\d%\s]+)\s*Area\s*\(Sq\s*ft\)\s*([\d,\s]+)\s*Squares\s*\*?\s*([\d.\s]+)(?:.*?(Measured))?(?:.*?(Suggested))?',
-            self.text_content,
-            re.IGNORECASE | re.DOTALL
-        )
+        waste_section = _RE_WASTE_SECTION.search(self.text_content)
         
         if waste_section:
-            pct_values = re.findall(r'(\d+)%?', waste_section.group(1))
-            area_values = re.findall(r'(\d+)', waste_section.group(2))
-            sq_values = re.findall(r'([\d.]+)', waste_section.group(3))
+            pct_values = _RE_WASTE_PCT_VALUE.findall(waste_section.group(1))
+            area_values = _RE_INTEGER_VALUE.findall(waste_section.group(2))
+            sq_values = _RE_DECIMAL_VALUE.findall(waste_section.group(3))
             
             # Determine suggested waste percentage
             # EagleView typically marks one column as "Suggested" - usually 10% for normal complexity
@@ -280,20 +453,12 @@ class EagleViewParser:
             suggested_pct = None
             
             # Check if there's explicit text indicating suggested percentage
-            suggested_match = re.search(
-                r'(\d+)%\s*\n?\s*Area.*?Suggested|Suggested.*?(\d+)%',
-                self.text_content,
-                re.IGNORECASE | re.DOTALL
-            )
+            suggested_match = _RE_SUGGESTED.search(self.text_content)
             
             # In most EagleView reports, 10% is suggested for normal complexity
             # The pattern shows columns with "Measured" under 0% and "Suggested" typically under 10%
             # Count position of "Suggested" label if it appears after the table
-            full_waste_section = re.search(
-                r'Waste\s*%\s*([\d%\s]+).*?Measured\s*(Suggested)?',
-                self.text_content,
-                re.IGNORECASE | re.DOTALL
-            )
+            full_waste_section = _RE_FULL_WASTE_SECTION.search(self.text_content)
             
             if full_waste_section and 'Suggested' in self.text_content:
                 # Find which column has the suggested marker
@@ -328,16 +493,27 @@ class EagleViewParser:
         
         return waste_calcs, suggested_waste
     
+    def _elevation_section(self, heading_end: int) -> Optional[str]:
+        """Wall table text of the elevation page whose heading ends at heading_end, or None"""
+        text = self.text_content
+        window_door = _RE_WINDOW_DOOR_LABEL.search(text, heading_end)
+        if not window_door:
+            return None
+        count = _RE_COUNT_LABEL.search(text, window_door.end())
+        if not count:
+            return None
+        end = _RE_ELEVATION_END.search(text, count.end())
+        return text[count.end():end.start() if end else len(text)]
+    
     def parse_windows_doors(self) -> List[WindowDoor]:
         """Extract window and door measurements"""
         windows_doors = []
         
         # Find all window/door entries in the text
-        # Pattern matches: I1 10.0 14.0 2.0 x 5.0
-        all_entries = re.findall(
-            r'([A-Z]\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*x\s*([\d.]+)',
-            self.text_content
-        )
+        all_entries = _RE_WD_ENTRY.findall(self.text_content)
+        if not all_entries:
+            # Nothing to assign directions to
+            return windows_doors
         
         # In EagleView reports, window/door labels have prefixes that correspond to wall labels
         # We can map them based on the Elevation diagrams or the wall area diagram
@@ -350,33 +526,28 @@ class EagleViewParser:
         # Get direction mapping from the window/door section
         direction_map = {}
         
-        # Parse each direction's entries from the elevation diagrams or window/door tables
-        wd_sections = re.findall(
-            r'(North|East|South|West)\s+(?:East|South|West|North)?\s*(?:Window/Door|Perimeter|Siding).*?(?=(?:North|East|South|West|Total\s+[\d,]+\s+[\d.]+|PAGE|\Z))',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
-        
-        # Alternative: find direction associations from elevation summaries
+        # Find direction associations from elevation summaries
         # Pattern: Wall | Siding | Masonry | Window & Door Area | etc with direction headers
-        for direction in ['North', 'East', 'South', 'West']:
+        heading_ends = {}
+        for m in _RE_ELEVATION_HEADING.finditer(self.text_content):
+            heading_ends.setdefault(m.group(1).title(), m.end())
+            if len(heading_ends) == 4:
+                break
+        for direction in _DIRECTIONS:
             # Find this direction's window/door entries in elevation diagrams
-            elev_pattern = rf'{direction}\s+ELEVATION.*?Window\s*&\s*Door.*?Count\s*(.*?)(?=(?:Note:|©|\Z))'
-            elev_match = re.search(elev_pattern, self.text_content, re.DOTALL | re.IGNORECASE)
+            heading_end = heading_ends.get(direction)
+            if heading_end is None:
+                continue
+            section_text = self._elevation_section(heading_end)
             
-            if elev_match:
-                section_text = elev_match.group(1)
+            if section_text is not None:
                 # Find wall labels in this section
-                wall_labels = re.findall(r'\b([A-Z])\s+[\d.]+\s+[\d.]+', section_text)
+                wall_labels = _RE_WALL_LABEL.findall(section_text)
                 for label in wall_labels:
                     direction_map[label] = direction
         
         # Also try to extract from the window/door table directly
-        wd_section = re.search(
-            r'WINDOW\s+AND\s+DOOR\s+DIAGRAM.*?(?=ELEVATION|REPORT\s+SUMMARY|\Z)',
-            self.text_content,
-            re.DOTALL | re.IGNORECASE
-        )
+        wd_section = _RE_WD_DIAGRAM.search(self.text_content)
         
         if wd_section:
             wd_text = wd_section.group(0)
@@ -384,52 +555,52 @@ class EagleViewParser:
             # Look for entries grouped by direction
             # The table shows directions as headers
             current_direction = None
-            lines = wd_text.split('\n')
+            line_end = -1
             
-            for line in lines:
+            for m in _RE_WD_SCAN.finditer(wd_text):
                 # Check for direction markers
-                dir_match = re.match(r'^(North|East|South|West)\b', line, re.IGNORECASE)
-                if dir_match:
-                    current_direction = dir_match.group(1).title()
+                if m.group('dir'):
+                    # Share one string per direction with the literal names
+                    current_direction = sys.intern(m.group('dir').title())
+                    continue
                 
-                # Look for window/door entries
-                entry_match = re.search(r'([A-Z]\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s*x\s*([\d.]+)', line)
-                if entry_match and current_direction:
-                    label = entry_match.group(1)
+                # Only the first window/door entry on each line counts
+                if m.start() < line_end:
+                    continue
+                line_end = wd_text.find('\n', m.start())
+                if line_end == -1:
+                    line_end = len(wd_text)
+                if current_direction:
                     # Map the wall letter to this direction
-                    wall_letter = label[0]
-                    if wall_letter not in direction_map:
-                        direction_map[wall_letter] = current_direction
+                    direction_map.setdefault(m.group('lbl')[0], current_direction)
         
-        # Now create WindowDoor objects using the direction mapping
+        # Now create WindowDoor objects using the direction mapping; every
+        # findall row has all five groups, so the tuples unpack directly
         seen_labels = set()
-        for entry in all_entries:
-            label = entry[0]
+        direction_of = direction_map.get
+        for label, area, perimeter, width, height in all_entries:
             if label in seen_labels:
                 continue
             seen_labels.add(label)
             
-            wall_letter = label[0]
-            direction = direction_map.get(wall_letter, 'Unknown')
-            
             try:
                 windows_doors.append(WindowDoor(
                     label=label,
-                    area_sqft=float(entry[1]),
-                    perimeter_ft=float(entry[2]),
-                    width_ft=float(entry[3]),
-                    height_ft=float(entry[4]),
-                    wall_direction=direction
+                    area_sqft=float(area),
+                    perimeter_ft=float(perimeter),
+                    width_ft=float(width),
+                    height_ft=float(height),
+                    wall_direction=direction_of(label[0], 'Unknown')
                 ))
-            except (ValueError, IndexError):
+            except ValueError:
                 continue
         
         return windows_doors
     
     def parse_coordinates(self) -> Dict[str, Optional[float]]:
         """Extract GPS coordinates"""
-        lat = self._extract_number(r'Latitude\s*[=:]\s*([-\d.]+)')
-        lon = self._extract_number(r'Longitude\s*[=:]\s*([-\d.]+)')
+        lat = self._extract_number(_RE_LATITUDE)
+        lon = self._extract_number(_RE_LONGITUDE)
         return {"latitude": lat, "longitude": lon}
     
     def parse(self) -> EagleViewReport:
@@ -474,16 +645,18 @@ class EagleViewParser:
                 "prepared_for_contact": report.prepared_for_contact,
                 "prepared_for_company": report.prepared_for_company
             },
-            "roof_measurements": asdict(report.roof),
-            "wall_measurements": asdict(report.walls) if report.walls else None,
-            "pitch_breakdown": [asdict(p) for p in report.pitch_breakdown],
-            "suggested_waste": asdict(report.suggested_waste) if report.suggested_waste else None,
-            "all_waste_calculations": [asdict(w) for w in report.waste_calculations],
-            "windows_doors": [asdict(wd) for wd in report.windows_doors]
+            "roof_measurements": _fields_dict(report.roof),
+            "wall_measurements": _fields_dict(report.walls) if report.walls else None,
+            "pitch_breakdown": [_fields_dict(p) for p in report.pitch_breakdown],
+            "suggested_waste": _fields_dict(report.suggested_waste) if report.suggested_waste else None,
+            "all_waste_calculations": [_fields_dict(w) for w in report.waste_calculations],
+            "windows_doors": [_fields_dict(wd) for wd in report.windows_doors]
         }
     
     def to_json(self, report: EagleViewReport, indent: int = 2) -> str:
         """Convert report to JSON string"""
+        if indent is None and orjson is not None:
+            return orjson.dumps(self.to_dict(report)).decode()
         return json.dumps(self.to_dict(report), indent=indent)
 
 
@@ -1,10 +1,21 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import hashlib
 import tempfile
 import os
-import json
 import sys
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 try:
@@ -12,7 +23,39 @@ try:
 except Exception:
     from eagleview_parser import EagleViewParser
 
-app = FastAPI()
+# Parsing is CPU-bound Python, so a thread would still hold the GIL and stall
+# every other request; worker processes keep the event loop free. Each worker
+# holds a whole report in memory, so the detected size is capped. The
+# affinity mask still ignores container CPU quotas; deployments size the pool
+# with PARSE_WORKERS instead (see render.yaml).
+_MAX_PARSE_WORKERS = 4
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _parse_worker_count() -> int:
+    """Worker processes for the parse pool: PARSE_WORKERS if set, else the usable CPUs up to the cap"""
+    configured = os.environ.get("PARSE_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, _MAX_PARSE_WORKERS))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _parse_pool
+    _parse_pool = ProcessPoolExecutor(max_workers=_parse_worker_count())
+    try:
+        yield
+    finally:
+        _parse_pool.shutdown(cancel_futures=True)
+        _parse_pool = None
+
+
+app = FastAPI(lifespan=lifespan)
 
 origins = os.environ.get("ALLOWED_ORIGINS", "*")
 app.add_middleware(
@@ -23,19 +66,75 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+def _json_response(content, status_code: int = 200) -> Response:
+    """Encode content once, with orjson when it is installed"""
+    if orjson is not None:
+        return Response(orjson.dumps(content), status_code=status_code, media_type="application/json")
+    return JSONResponse(status_code=status_code, content=content)
+
+
+# Parsed payloads of recent uploads, keyed by a digest of the PDF bytes, so
+# re-posting the same report skips the parse. Failures are not cached.
+_PARSE_CACHE_SIZE = 32
+_parse_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+
+
+def _parse_file(path: str) -> dict:
+    """Parse a PDF on disk into the response payload; runs in a worker process"""
+    parser = EagleViewParser(path)
+    return parser.to_dict(parser.parse())
+
+
+async def _parse_in_pool(path: str) -> dict:
+    """Run _parse_file in the worker pool, retrying once on a fresh pool if a worker died"""
+    global _parse_pool
+    pool = _parse_pool
+    if pool is None:
+        raise RuntimeError("parse pool is not running; start the app with its lifespan")
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, _parse_file, path)
+    except BrokenProcessPool:
+        # A worker was killed (e.g. out of memory). Only the first request to
+        # notice replaces the pool; the others retry on its replacement
+        if _parse_pool is pool:
+            _parse_pool = ProcessPoolExecutor(max_workers=_parse_worker_count())
+            pool.shutdown(wait=False, cancel_futures=True)
+        retry_pool = _parse_pool
+        if retry_pool is None:
+            raise
+        return await loop.run_in_executor(retry_pool, _parse_file, path)
+
+
 @app.post("/parse")
 async def parse(request: Request):
-    data = await request.body()
+    # Write the upload as it arrives instead of buffering the whole body first
+    digest = hashlib.blake2b(digest_size=16)
     with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(data)
         tmp_path = tmp.name
+        try:
+            async for chunk in request.stream():
+                tmp.write(chunk)
+                digest.update(chunk)
+        except BaseException:
+            # Client disconnected mid-upload; don't leave the partial file behind
+            os.unlink(tmp_path)
+            raise
+    key = digest.digest()
     try:
-        parser = EagleViewParser(tmp_path)
-        report = parser.parse()
-        payload = json.loads(parser.to_json(report))
-        return JSONResponse({"success": True, "data": payload})
+        payload = _parse_cache.get(key)
+        if payload is not None:
+            _parse_cache.move_to_end(key)
+        else:
+            # Parsing blocks for seconds on large reports; keep it off the event loop
+            payload = await _parse_in_pool(tmp_path)
+            _parse_cache[key] = payload
+            if len(_parse_cache) > _PARSE_CACHE_SIZE:
+                _parse_cache.popitem(last=False)
+        return _json_response({"success": True, "data": payload})
     except Exception as e:
-        return JSONResponse(status_code=500, content={"success": False, "error": "parse_failed", "detail": str(e)})
+        return _json_response({"success": False, "error": "parse_failed", "detail": str(e)}, status_code=500)
     finally:
         try:
             os.unlink(tmp_path)
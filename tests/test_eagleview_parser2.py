@@ -0,0 +1,83 @@
+"""Regression tests for EagleView_Parser2, run with python -m unittest"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import EagleView_Parser2
+
+
+class _FakePage:
+    def __init__(self, text):
+        self._text = text
+
+    def extract_text(self):
+        return self._text
+
+
+class _FakePDF:
+    def __init__(self, pages):
+        self.pages = [_FakePage(text) for text in pages]
+
+    def close(self):
+        pass
+
+
+def _parser_for(*pages):
+    """Parser whose extracted text is the given pages"""
+    parser = EagleView_Parser2.EagleViewParser("report.pdf")
+    with mock.patch.object(EagleView_Parser2.pdfplumber, "open", return_value=_FakePDF(pages)), \
+            mock.patch("os.path.getmtime", return_value=1.0):
+        parser.extract_text()
+    return parser
+
+
+class StructureComplexityTest(unittest.TestCase):
+    def test_rated_from_the_parsed_pitch_breakdown(self):
+        # Without a % of Roof row the breakdown is empty, so the 12/12 in the
+        # raw Roof Pitches row must not make the structure Complex
+        parser = _parser_for(
+            "REPORT SUMMARY\n"
+            "Structure #1\n"
+            "Areas per Pitch\n"
+            "Roof Pitches 4/12 6/12 12/12\n"
+            "Area (sq ft) 100.0 200.0 300.0\n",
+        )
+        structures = parser.parse_structures()
+        self.assertEqual(len(structures), 1)
+        self.assertEqual(structures[0].pitch_breakdown, [])
+        self.assertEqual(structures[0].complexity, "Simple")
+
+
+class WindowsDoorsTest(unittest.TestCase):
+    def test_upper_case_table_of_contents_entry(self):
+        # The contents line repeats the table heading in upper case; the
+        # entries and their directions must still come from the table page
+        parser = _parser_for(
+            "TABLE OF CONTENTS\n"
+            "WINDOW AND DOOR DIAGRAM.....13\n"
+            "ELEVATION DIAGRAMS.....14\n",
+            "WINDOW AND DOOR DIAGRAM\n"
+            "Label Area Perimeter Size\n"
+            "I1 10.0 14.0 2.0 x 5.0\n"
+            "A1 20.0 18.0 4.0 x 5.0\n",
+            "NORTH ELEVATION\n"
+            "Wall Siding Masonry Window & Door Count\n"
+            "I 120.0 10.0 1\n"
+            "Note: walls are measured to the eaves\n",
+            "SOUTH ELEVATION\n"
+            "Wall Siding Masonry Window & Door Count\n"
+            "A 200.0 20.0 1\n"
+            "Note: walls are measured to the eaves\n",
+        )
+        entries = parser.parse_windows_doors()
+        self.assertEqual(
+            [(w.label, w.area_sqft, w.wall_direction) for w in entries],
+            [("I1", 10.0, "North"), ("A1", 20.0, "South")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
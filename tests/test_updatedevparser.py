@@ -0,0 +1,121 @@
+"""Regression tests for UPDATEDevParser, run with python -m unittest"""
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import UPDATEDevParser
+
+
+class _FakePage:
+    def __init__(self, text):
+        self._text = text
+
+    def extract_text(self):
+        return self._text
+
+    def close(self):
+        pass
+
+
+class _FakePDF:
+    def __init__(self, pages):
+        self.pages = [_FakePage(text) for text in pages]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _parser_for(*pages):
+    """Parser whose extracted text is the given pages"""
+    parser = UPDATEDevParser.EagleViewParser("report.pdf")
+    with mock.patch.object(UPDATEDevParser.pdfplumber, "open", return_value=_FakePDF(pages)):
+        parser.extract_text()
+    return parser
+
+
+class RoofLinesTest(unittest.TestCase):
+    def test_no_break_space_around_equals(self):
+        nbsp = "\u00a0"
+        parser = _parser_for(
+            f"Ridges{nbsp}={nbsp}48 ft\n"
+            f"Hips{nbsp}={nbsp}12 ft\n"
+            f"Step flashing{nbsp}={nbsp}7 ft\n"
+            f"Flashing{nbsp}={nbsp}9 ft\n"
+        )
+        roof = parser.parse_roof_measurements()
+        self.assertEqual(roof.ridges_ft, 48.0)
+        self.assertEqual(roof.hips_ft, 12.0)
+        self.assertEqual(roof.step_flashing_ft, 7.0)
+        self.assertEqual(roof.flashing_ft, 9.0)
+
+    def test_flashing_also_matches_a_double_spaced_step_flashing(self):
+        # "Step  Flashing" slips past Flashing's (?<!Step\s) lookbehind, so it
+        # sets both fields, as the separate searches did
+        roof = _parser_for("Step  Flashing = 7 ft\nFlashing = 9 ft\n").parse_roof_measurements()
+        self.assertEqual(roof.step_flashing_ft, 7.0)
+        self.assertEqual(roof.flashing_ft, 7.0)
+
+    def test_unparseable_hips_is_zero(self):
+        roof = _parser_for("Hips = , ft\nRidges = 5 ft\n").parse_roof_measurements()
+        self.assertEqual(roof.hips_ft, 0)
+        self.assertEqual(roof.ridges_ft, 5.0)
+
+
+class ReportSummaryTest(unittest.TestCase):
+    def test_first_structure_heading_in_title_case(self):
+        parser = _parser_for(
+            "Report Summary\n"
+            "Structure #1\n"
+            "Areas per Pitch\n"
+            "Roof Pitches 4/12 6/12\n"
+            "Area (sq ft) 100.0 200.0\n"
+            "% of Roof 33.3% 66.7%\n",
+            "REPORT SUMMARY\n"
+            "Structure #2\n"
+            "Areas per Pitch\n"
+            "Roof Pitches 7/12\n"
+            "Area (sq ft) 401.1\n"
+            "% of Roof 100%\n",
+        )
+        pitches = parser.parse_pitch_breakdown()
+        self.assertEqual([p.pitch for p in pitches], ["4/12", "6/12"])
+
+
+class WasteCalculationsTest(unittest.TestCase):
+    def test_measured_before_the_matched_table_still_marks_suggested(self):
+        # The first Waste % header has no table under it; the table that
+        # matches comes later and has no "Measured" label after it
+        parser = _parser_for(
+            "REPORT SUMMARY\n"
+            "Waste % 0% 10%\n"
+            "Measured Suggested\n"
+            "Waste % 0% 10% 12%\n"
+            "Area (Sq ft) 100 110 112\n"
+            "Squares * 1.00 1.10 1.13\n"
+        )
+        waste_calcs, suggested = parser.parse_waste_calculations()
+        self.assertEqual([w.waste_percent for w in waste_calcs], [0, 10, 12])
+        self.assertIsNotNone(suggested)
+        self.assertEqual(suggested.waste_percent, 10)
+
+
+class ReportCacheTest(unittest.TestCase):
+    def test_failed_store_is_swallowed_and_cleaned_up(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            parser = UPDATEDevParser.EagleViewParser("report.pdf", cache_dir=cache_dir)
+            cache_path = os.path.join(cache_dir, "entry.pkl")
+            with mock.patch.object(UPDATEDevParser.pickle, "dump", side_effect=pickle.PicklingError):
+                parser._store_cached(cache_path, object())
+            self.assertEqual(os.listdir(cache_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()